@@ -4,8 +4,14 @@ The Blender script (`io_flver.py`) will ensure that the mini-Soulstruct module i
 you will have to restart Blender to see any changes to this mini-module, as `Reload Scripts` in Blender will not
 re-import it.
 """
+import fnmatch
+import hashlib
+import json
+import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from soulstruct.utilities.files import PACKAGE_PATH
@@ -14,10 +20,114 @@ from soulstruct_havok.utilities.files import HAVOK_PACKAGE_PATH
 
 
 PY_SITE_PACKAGES = Path(__file__).parent / "venv-blender311/Lib/site-packages"
+INSTALL_MANIFEST_NAME = ".install_manifest.json"
+ADDON_IGNORE_PATTERNS = ("__pycache__", "*.pyc", "__address_cache__", "soulstruct_config.json", "soulstruct.log")
+# Files that may be written in place at runtime. These are always copied, never hard-linked, so that writing them in the
+# installed add-on cannot modify the source tree.
+RUNTIME_WRITTEN_PATTERNS = ("SoulstructSettings.json", "soulstruct_config.json", "soulstruct.log")
 
 
-def copy_addon(addons_dir: str | Path, copy_soulstruct_module=True, copy_third_party_modules=True, clear_settings=True):
-    """Copy `io_soulstruct` and (by default) `io_soulstruct_lib` into given `addons_dir` parent directory."""
+def _link_or_copy(src: str, dst: str, link_files=False) -> str:
+    """`copy_function` for `shutil.copytree` that skips files that are already up to date.
+
+    Destination files that already have the same size and modification time as the source are left alone. If
+    `link_files` is True, files are hard-linked rather than having their bytes copied where possible, EXCEPT for
+    `RUNTIME_WRITTEN_PATTERNS` files. Linked files share their data with the source, so any in-place write to them in
+    the installed add-on also changes the source. Falls back to `shutil.copy2` if hard-linking fails (e.g. when the
+    destination is on a different drive).
+    """
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        pass
+    else:
+        src_stat = os.stat(src)
+        if dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns == src_stat.st_mtime_ns:
+            return dst  # already up to date
+        os.remove(dst)
+    if link_files and not any(fnmatch.fnmatch(os.path.basename(src), p) for p in RUNTIME_WRITTEN_PATTERNS):
+        try:
+            os.link(src, dst)
+        except OSError:
+            pass
+        else:
+            return dst
+    shutil.copy2(src, dst)
+    return dst
+
+
+def _hash_file(path: Path) -> str:
+    hasher = hashlib.blake2b()
+    with path.open("rb") as f:
+        while chunk := f.read(1 << 20):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _get_source_file_hashes(src_dir: Path, ignore_patterns: tuple[str, ...]) -> dict[str, str]:
+    """Hash all files in `src_dir` (except those matching `ignore_patterns`), keyed by relative POSIX path."""
+    file_hashes = {}
+    for dir_path, dir_names, file_names in os.walk(src_dir):
+        dir_names[:] = [d for d in dir_names if not any(fnmatch.fnmatch(d, p) for p in ignore_patterns)]
+        for file_name in file_names:
+            if any(fnmatch.fnmatch(file_name, p) for p in ignore_patterns):
+                continue
+            file_path = Path(dir_path, file_name)
+            file_hashes[file_path.relative_to(src_dir).as_posix()] = _hash_file(file_path)
+    return file_hashes
+
+
+def _sync_dir_with_manifest(src_dir: Path, dest_dir: Path, ignore_patterns: tuple[str, ...], link_files=False):
+    """Copy `src_dir` to `dest_dir`, only copying files whose content hash differs from the last sync.
+
+    Hashes from the last sync are stored in a manifest file in `dest_dir`. If there is no manifest, `dest_dir` is
+    cleared and fully copied. Files recorded in the old manifest that no longer exist in `src_dir` are removed, but
+    other files in `dest_dir` (e.g. user settings) are left alone.
+    """
+    manifest_path = dest_dir / INSTALL_MANIFEST_NAME
+    source_hashes = _get_source_file_hashes(src_dir, ignore_patterns)
+
+    try:
+        old_hashes = json.loads(manifest_path.read_text())  # type: dict[str, str]
+    except (FileNotFoundError, ValueError):
+        # No valid manifest. Do full copy.
+        if dest_dir.is_dir():
+            shutil.rmtree(dest_dir, ignore_errors=False)
+        shutil.copytree(
+            src_dir,
+            dest_dir,
+            ignore=shutil.ignore_patterns(*ignore_patterns),
+            copy_function=partial(_link_or_copy, link_files=link_files),
+        )
+    else:
+        for rel_path, file_hash in source_hashes.items():
+            dest_path = dest_dir / rel_path
+            if old_hashes.get(rel_path) == file_hash and dest_path.is_file():
+                continue  # unchanged
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            dest_path.unlink(missing_ok=True)
+            _link_or_copy(str(src_dir / rel_path), str(dest_path), link_files=link_files)
+        for rel_path in old_hashes.keys() - source_hashes.keys():
+            (dest_dir / rel_path).unlink(missing_ok=True)
+
+    manifest_path.write_text(json.dumps(source_hashes, indent=0, sort_keys=True))
+
+
+def copy_addon(
+    addons_dir: str | Path,
+    copy_soulstruct_module=True,
+    copy_third_party_modules=True,
+    clear_settings=True,
+    use_manifest=False,
+    link_files=False,
+):
+    """Copy `io_soulstruct` and (by default) `io_soulstruct_lib` into given `addons_dir` parent directory.
+
+    If `use_manifest` is True, only `io_soulstruct` files that have changed since the last copy are written.
+
+    If `link_files` is True, files are hard-linked to their sources where possible (see `_link_or_copy`).
+    """
+    copy_function = partial(_link_or_copy, link_files=link_files)
 
     addons_dir = Path(addons_dir)
 
@@ -32,15 +142,21 @@ def copy_addon(addons_dir: str | Path, copy_soulstruct_module=True, copy_third_p
     # Install actual Blender scripts, preserving existing 'SoulstructSettings.json' only.
     settings_path = dest_io_soulstruct_dir / "SoulstructSettings.json"
     settings_data = settings_path.read_bytes() if not clear_settings and settings_path.is_file() else b""
-    if dest_io_soulstruct_dir.is_dir():
-        shutil.rmtree(dest_io_soulstruct_dir, ignore_errors=False)
-    shutil.copytree(
-        src_io_soulstruct_dir,
-        dest_io_soulstruct_dir,
-        ignore=shutil.ignore_patterns(
-            "__pycache__", "*.pyc", "__address_cache__", "soulstruct_config.json", "soulstruct.log"
-        ),
-    )
+    if use_manifest:
+        _sync_dir_with_manifest(
+            src_io_soulstruct_dir, dest_io_soulstruct_dir, ADDON_IGNORE_PATTERNS, link_files=link_files
+        )
+        if clear_settings:
+            settings_path.unlink(missing_ok=True)
+    else:
+        if dest_io_soulstruct_dir.is_dir():
+            shutil.rmtree(dest_io_soulstruct_dir, ignore_errors=False)
+        shutil.copytree(
+            src_io_soulstruct_dir,
+            dest_io_soulstruct_dir,
+            ignore=shutil.ignore_patterns(*ADDON_IGNORE_PATTERNS),
+            copy_function=copy_function,
+        )
     if settings_data:
         settings_path.write_bytes(settings_data)
     print(f"# Blender addon `io_soulstruct` installed to '{addons_dir}'.")
@@ -55,6 +171,7 @@ def copy_addon(addons_dir: str | Path, copy_soulstruct_module=True, copy_third_p
             dest_io_soulstruct_lib_dir / "soulstruct",
             dirs_exist_ok=True,
             ignore=shutil.ignore_patterns("*.pyc", "__pycache__", "oo2core_6_win64.dll"),
+            copy_function=copy_function,
         )
 
         # Copy over `oo2core_6_win64.dll` if it exists and isn't already in destination folder.
@@ -71,18 +188,26 @@ def copy_addon(addons_dir: str | Path, copy_soulstruct_module=True, copy_third_p
                 dest_io_soulstruct_lib_dir / "soulstruct_havok",
                 ignore=ignore_pycache,
                 dirs_exist_ok=True,
+                copy_function=copy_function,
             )
 
     if copy_third_party_modules:
         # NOTE: Blender already comes with `numpy`.
-        copy_site_package("colorama", dest_io_soulstruct_lib_dir / "colorama")
-        copy_site_package("scipy", dest_io_soulstruct_lib_dir / "scipy")
-        copy_site_package("scipy.libs", dest_io_soulstruct_lib_dir / "scipy.libs")
+        copy_site_package("colorama", dest_io_soulstruct_lib_dir / "colorama", link_files)
+        copy_site_package("scipy", dest_io_soulstruct_lib_dir / "scipy", link_files)
+        copy_site_package("scipy.libs", dest_io_soulstruct_lib_dir / "scipy.libs", link_files)
 
 
-def install(blender_addons_dir: str | Path, update_soulstruct_module=False, update_third_party_modules=False):
+def install(
+    blender_addons_dir: str | Path,
+    update_soulstruct_module=False,
+    update_third_party_modules=False,
+    link_files=False,
+):
     """Install add-on to a real Blender scripts directory, with optional updating of bundled libraries.
 
+    If `link_files` is True, installed files are hard-linked to their sources where possible (see `_link_or_copy`).
+
     `blender_scripts_dir` should be the `scripts` folder in a specific version of Blender inside your AppData.
 
     For example:
@@ -100,42 +225,65 @@ def install(blender_addons_dir: str | Path, update_soulstruct_module=False, upda
 
     blender_addons_dir.mkdir(exist_ok=True, parents=True)
 
-    copy_addon(blender_addons_dir, update_soulstruct_module, update_third_party_modules, clear_settings=False)
+    copy_addon(
+        blender_addons_dir,
+        update_soulstruct_module,
+        update_third_party_modules,
+        clear_settings=False,
+        use_manifest=True,
+        link_files=link_files,
+    )
 
 
-def copy_site_package(dir_name: str, destination_dir: Path):
+def copy_site_package(dir_name: str, destination_dir: Path, link_files=False):
     """Blender 4.1 onwards requires Python 3.11 versions."""
     if not PY_SITE_PACKAGES.is_dir():
         raise FileNotFoundError(f"Could not find site-packages directory: {PY_SITE_PACKAGES}.")
     package_dir = PY_SITE_PACKAGES / dir_name
     if not package_dir.is_dir():
         raise FileNotFoundError(f"Could not find site-package directory: {package_dir}.")
-    shutil.copytree(
-        package_dir,
-        destination_dir,
-        ignore=shutil.ignore_patterns("*.pyc", "__pycache__"),
-        dirs_exist_ok=True,
-    )
+
+    # Packages like `scipy` contain thousands of small files, so we create the directory tree first and then copy files
+    # on multiple threads (which mostly just wait on file system calls).
+    ignore_patterns = ("*.pyc", "__pycache__")
+    copy_pairs = []  # type: list[tuple[str, str]]
+    for dir_path, dir_names, file_names in os.walk(package_dir):
+        dir_names[:] = [d for d in dir_names if not any(fnmatch.fnmatch(d, p) for p in ignore_patterns)]
+        dest_dir_path = destination_dir / Path(dir_path).relative_to(package_dir)
+        dest_dir_path.mkdir(parents=True, exist_ok=True)
+        for file_name in file_names:
+            if not any(fnmatch.fnmatch(file_name, p) for p in ignore_patterns):
+                copy_pairs.append((os.path.join(dir_path, file_name), str(dest_dir_path / file_name)))
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        # Consume results so that any copy errors are raised here.
+        for _ in executor.map(lambda pair: _link_or_copy(*pair, link_files=link_files), copy_pairs):
+            pass
 
 
 def main(args):
+    # Hard-linking installed files to their sources is opt-in.
+    link_files = "--link" in args
+    args = [arg for arg in args if arg != "--link"]
     match args:
         case [release_directory, "--release"]:
             # This is just a copy, not a local Blender install.
             copy_addon(release_directory, copy_soulstruct_module=True, copy_third_party_modules=True)
         case [addons_directory, "--updateSoulstruct", "--updateThirdParty"]:
-            install(addons_directory, update_soulstruct_module=True, update_third_party_modules=True)
+            install(
+                addons_directory, update_soulstruct_module=True, update_third_party_modules=True, link_files=link_files
+            )
         case [addons_directory, "--updateSoulstruct"]:
-            install(addons_directory, update_soulstruct_module=True)
+            install(addons_directory, update_soulstruct_module=True, link_files=link_files)
         case [addons_directory, "--updateThirdParty"]:
-            install(addons_directory, update_third_party_modules=True)
+            install(addons_directory, update_third_party_modules=True, link_files=link_files)
         case [addons_directory]:
-            install(addons_directory, update_soulstruct_module=False)
+            install(addons_directory, update_soulstruct_module=False, link_files=link_files)
         case _:
             print(
                 f"INVALID ARGUMENTS: {sys.argv}\n"
                 f"Usage: `python install_addon.py [addons_directory] "
-                f"[--release] [--updateSoulstruct] [--updateThirdParty]`"
+                f"[--release] [--updateSoulstruct] [--updateThirdParty] [--link]`"
             )
 
 
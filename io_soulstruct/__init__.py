@@ -7,6 +7,20 @@ separately.
 """
 from __future__ import annotations
 
+# NOTE: Kept above all imports, so Blender's add-on scan finds it without reading past them.
+bl_info = {
+    "name": "Soulstruct",
+    "author": "Scott Mooney (Grimrukh)",
+    "version": (2, 0, 0),
+    "blender": (4, 2, 0),
+    "location": "File > Import-Export",
+    "description": "Import, manipulate, and export FromSoftware/Havok assets",
+    "warning": "",
+    "doc_url": "https://github.com/Grimrukh/soulstruct-blender",
+    "support": "COMMUNITY",
+    "category": "Import-Export",
+}
+
 import importlib
 import sys
 from pathlib import Path
@@ -34,12 +48,14 @@ def try_reload(_module_name: str):
 # Reload all Soulstruct modules, then all modules in this add-on (except this script).
 # NOTE: This is IMPORTANT when using 'Reload Scripts' in Blender, as it is otherwise prone to partial re-imports of
 # Soulstruct that duplicate classes and cause wild bugs with `isinstance`, object ID equality, etc.
-for module_name in list(sys.modules.keys()):
-    if "io_soulstruct" not in module_name and "soulstruct" in module_name.split(".")[0]:
-        try_reload(module_name)
-for module_name in list(sys.modules.keys()):
-    if module_name != "io_soulstruct" and "io_soulstruct" in module_name.split(".")[0]:  # don't reload THIS module
-        try_reload(module_name)
+# On a fresh add-on load, none of our submodules have been imported yet, so the (slow) reload pass is skipped.
+if "io_soulstruct.general" in sys.modules:
+    for module_name in list(sys.modules.keys()):
+        if "io_soulstruct" not in module_name and "soulstruct" in module_name.split(".")[0]:
+            try_reload(module_name)
+    for module_name in list(sys.modules.keys()):
+        if module_name != "io_soulstruct" and "io_soulstruct" in module_name.split(".")[0]:  # don't reload THIS
+            try_reload(module_name)
 
 from io_soulstruct.general import *
 from io_soulstruct.misc_operators import *
@@ -54,20 +70,6 @@ from io_soulstruct.navmesh import *
 from io_soulstruct.types import SoulstructType
 
 
-bl_info = {
-    "name": "Soulstruct",
-    "author": "Scott Mooney (Grimrukh)",
-    "version": (2, 0, 0),
-    "blender": (4, 2, 0),
-    "location": "File > Import-Export",
-    "description": "Import, manipulate, and export FromSoftware/Havok assets",
-    "warning": "",
-    "doc_url": "https://github.com/Grimrukh/soulstruct-blender",
-    "support": "COMMUNITY",
-    "category": "Import-Export",
-}
-
-
 # TODO: Add more operators to menu functions.
 
 
@@ -6,9 +6,30 @@ __all__ = [
 ]
 
 import bpy
-from .import_operators import *
-from .export_operators import *
-from .misc_operators import *
+from .import_operators import (
+    ImportHKXAnimation,
+    ImportCharacterHKXAnimation,
+    ImportObjectHKXAnimation,
+    ImportAssetHKXAnimation,
+)
+from .export_operators import (
+    ExportLooseHKXAnimation,
+    ExportHKXAnimationIntoBinder,
+    ExportCharacterHKXAnimation,
+    ExportObjectHKXAnimation,
+)
+from .misc_operators import SelectArmatureActionOperator
+
+# Operator IDs are fixed at class definition, so they are resolved once here rather than on every panel redraw.
+_IMPORT_HKX_ANIMATION = ImportHKXAnimation.bl_idname
+_IMPORT_CHARACTER_HKX_ANIMATION = ImportCharacterHKXAnimation.bl_idname
+_IMPORT_OBJECT_HKX_ANIMATION = ImportObjectHKXAnimation.bl_idname
+_IMPORT_ASSET_HKX_ANIMATION = ImportAssetHKXAnimation.bl_idname
+_EXPORT_LOOSE_HKX_ANIMATION = ExportLooseHKXAnimation.bl_idname
+_EXPORT_HKX_ANIMATION_INTO_BINDER = ExportHKXAnimationIntoBinder.bl_idname
+_EXPORT_CHARACTER_HKX_ANIMATION = ExportCharacterHKXAnimation.bl_idname
+_EXPORT_OBJECT_HKX_ANIMATION = ExportObjectHKXAnimation.bl_idname
+_SELECT_ARMATURE_ACTION_OPERATOR = SelectArmatureActionOperator.bl_idname
 
 
 class AnimationImportExportPanel(bpy.types.Panel):
@@ -19,40 +40,41 @@ class AnimationImportExportPanel(bpy.types.Panel):
     bl_category = "Animation"
     bl_options = {"DEFAULT_CLOSED"}
 
-    # noinspection PyUnusedLocal
+    @classmethod
+    def poll(cls, context):
+        """Import/export is only supported for DSR and ER. Hiding the panel otherwise skips `draw` entirely."""
+        return context.scene.soulstruct_settings.is_game("DARK_SOULS_DSR", "ELDEN_RING")
+
     def draw(self, context):
         settings = context.scene.soulstruct_settings
-        if not settings.is_game("DARK_SOULS_DSR", "ELDEN_RING"):
-            self.layout.label(text="Import/Export for DSR and ER only.")
-            return
-
         header, panel = self.layout.panel("Import", default_closed=False)
         header.label(text="Import")
         if panel:
             if settings.import_roots != (None, None):
                 panel.label(text="Import from Game/Project")
-                panel.operator(ImportCharacterHKXAnimation.bl_idname)
+                panel.operator(_IMPORT_CHARACTER_HKX_ANIMATION)
                 if settings.game_variable_name == "ELDEN_RING":
-                    panel.operator(ImportAssetHKXAnimation.bl_idname)
+                    panel.operator(_IMPORT_ASSET_HKX_ANIMATION)
                 else:
-                    panel.operator(ImportObjectHKXAnimation.bl_idname)
+                    panel.operator(_IMPORT_OBJECT_HKX_ANIMATION)
             else:
                 panel.label(text="No game root path set.")
             panel.label(text="Generic Import:")
-            panel.operator(ImportHKXAnimation.bl_idname, text="Import Any Animation")
+            panel.operator(_IMPORT_HKX_ANIMATION, text="Import Any Animation")
+
+        if settings.game_variable_name != "DARK_SOULS_DSR":
+            self.layout.label(text="Export for DSR only.")
+            return
 
         header, panel = self.layout.panel("Export", default_closed=False)
         header.label(text="Export")
         if panel:
-            if settings.game_variable_name not in {"DARK_SOULS_DSR"}:
-                panel.label(text="Export for DSR only.")
-            else:
-                panel.label(text="Export to Project/Game")
-                panel.operator(ExportCharacterHKXAnimation.bl_idname)
-                panel.operator(ExportObjectHKXAnimation.bl_idname)
-                panel.label(text="Generic Export:")
-                panel.operator(ExportLooseHKXAnimation.bl_idname)
-                panel.operator(ExportHKXAnimationIntoBinder.bl_idname)
+            panel.label(text="Export to Project/Game")
+            panel.operator(_EXPORT_CHARACTER_HKX_ANIMATION)
+            panel.operator(_EXPORT_OBJECT_HKX_ANIMATION)
+            panel.label(text="Generic Export:")
+            panel.operator(_EXPORT_LOOSE_HKX_ANIMATION)
+            panel.operator(_EXPORT_HKX_ANIMATION_INTO_BINDER)
 
 
 class AnimationToolsPanel(bpy.types.Panel):
@@ -64,5 +86,5 @@ class AnimationToolsPanel(bpy.types.Panel):
     bl_options = {"DEFAULT_CLOSED"}
 
     def draw(self, context):
-        self.layout.operator(SelectArmatureActionOperator.bl_idname)
+        self.layout.operator(_SELECT_ARMATURE_ACTION_OPERATOR)
         # TODO: decimate operator with ratio field
@@ -104,7 +104,7 @@ class SoulstructAnimation:
         track_bone_names = [
             annotation.trackName for annotation in animation_hkx.animation_container.animation.annotationTracks
         ]
-        bl_bone_names = [b.name for b in armature.data.bones]
+        bl_bone_names = {b.name for b in armature.data.bones}
         for bone_name in track_bone_names:
             if bone_name not in bl_bone_names:
                 raise AnimationImportError(f"Animation bone name '{bone_name}' is missing from Armature.")
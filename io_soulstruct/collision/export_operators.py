@@ -8,6 +8,8 @@ __all__ = [
 
 import re
 import traceback
+import typing as tp
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import bpy
@@ -22,6 +24,10 @@ from soulstruct_havok.wrappers.shared import BothResHKXBHD
 from io_soulstruct.types import SoulstructType
 from io_soulstruct.utilities import *
 from .types import *
+from .utilities import get_relative_hkxbhd_hkxbdt_paths
+
+if tp.TYPE_CHECKING:
+    from soulstruct_havok.wrappers.shared import HKXBHD
 
 
 LOOSE_HKX_COLLISION_STEM_RE = re.compile(r"^([hl])(\w{6})A(\d\d)$")  # game-readable model name; no extensions
@@ -54,14 +60,12 @@ class ExportLooseHKXMapCollision(LoggingOperator, ExportHelper):
     @classmethod
     def poll(cls, context):
         """Must select a single mesh."""
-        settings = cls.settings(context)
-        if not settings.is_game(DARK_SOULS_DSR):
-            return False  # TODO: DS1R only.
-        if not context.active_object:
+        # Cheap object checks first, as `settings()` also saves settings to disk.
+        active_object = context.active_object
+        if not active_object or active_object.soulstruct_type != SoulstructType.COLLISION:
             return False
-        if context.active_object.soulstruct_type != SoulstructType.COLLISION:
-            return False
-        return True
+        settings = cls.settings(context)
+        return settings.is_game(DARK_SOULS_DSR)  # TODO: DS1R only.
 
     def invoke(self, context, _event):
         """Set default export name to name of object (before first space and without Blender dupe suffix)."""
@@ -90,8 +94,9 @@ class ExportLooseHKXMapCollision(LoggingOperator, ExportHelper):
             return self.error("This operator only supports Dark Souls 1 (PTDE and DSR).")
 
         hkx_path = Path(self.filepath)
-        if not LOOSE_HKX_COLLISION_STEM_RE.match(hkx_path.name) is None:
-            return self.warning(
+        if LOOSE_HKX_COLLISION_STEM_RE.match(hkx_path.name.split(".")[0]) is None:
+            # Not fatal: user chooses the exported file name.
+            self.warning(
                 f"HKX file name '{hkx_path.name}' does not match the expected name pattern for "
                 f"a HKX collision parent object and will not function in-game: 'h......A..' or 'l......A..'"
             )
@@ -185,14 +190,12 @@ class ExportHKXMapCollisionIntoBinder(LoggingOperator, ImportHelper):
     def poll(cls, context):
         """Must select a single mesh."""
         # TODO: Why not all selected models at once?
-        settings = cls.settings(context)
-        if not settings.is_game(DARK_SOULS_DSR):
-            return False  # TODO: DS1R only.
-        if not context.active_object:
-            return False
-        if context.active_object.soulstruct_type != SoulstructType.COLLISION:
+        # Cheap object checks first, as `settings()` also saves settings to disk.
+        active_object = context.active_object
+        if not active_object or active_object.soulstruct_type != SoulstructType.COLLISION:
             return False
-        return True
+        settings = cls.settings(context)
+        return settings.is_game(DARK_SOULS_DSR)  # TODO: DS1R only.
 
     def execute(self, context):
         if not self.poll(context):
@@ -267,17 +270,14 @@ class ExportHKXMapCollisionIntoHKXBHD(LoggingOperator):
 
         TODO: Also currently for DS1R only.
         """
-        settings = cls.settings(context)
-        if not settings.can_auto_export:
-            return False
-        if not settings.is_game(DARK_SOULS_DSR):
+        # Cheap object checks first, as `settings()` also saves settings to disk.
+        selected_objects = context.selected_objects
+        if not selected_objects:
             return False
-        if not context.selected_objects:
+        if not all(obj.soulstruct_type == SoulstructType.COLLISION for obj in selected_objects):
             return False
-        for obj in context.selected_objects:
-            if obj.soulstruct_type != SoulstructType.COLLISION:
-                return False
-        return True
+        settings = cls.settings(context)
+        return settings.can_auto_export and settings.is_game(DARK_SOULS_DSR)
 
     def execute(self, context):
         if not self.poll(context):
@@ -287,9 +287,15 @@ class ExportHKXMapCollisionIntoHKXBHD(LoggingOperator):
         dcx_type = DCXType.DS1_DS2  # DS1R (inside HKXBHD)
         bl_map_collisions = BlenderMapCollision.from_selected_objects(context)  # type: list[BlenderMapCollision]
 
-        opened_both_res_hkxbhds = {}  # type: dict[str, BothResHKXBHD]  # keys are map stems
+        collection_map_stems = (
+            get_collection_map_stems(bl.obj for bl in bl_map_collisions) if settings.detect_map_from_collection else {}
+        )
         return_strings = set()
 
+        # First pass: validate names and group collisions by destination map, without doing any export work. Each
+        # unique detected map stem is resolved to its oldest version only once.
+        export_items_by_map_stem = {}  # type: dict[str, list[tuple[BlenderMapCollision, str]]]  # (collision, model)
+        oldest_map_stems = {}  # type: dict[str, str]  # detected map stem -> oldest version
         for bl_map_collision in bl_map_collisions:
 
             if bl_map_collision.name[0] not in "hl":
@@ -298,7 +304,12 @@ class ExportHKXMapCollisionIntoHKXBHD(LoggingOperator):
                 )
                 continue
 
-            map_stem = settings.get_map_stem_for_export(bl_map_collision.obj, oldest=True)
+            map_stem = settings.get_map_stem_for_export(
+                bl_map_collision.obj,
+                oldest=True,
+                collection_map_stems=collection_map_stems,
+                versioned_map_stems=oldest_map_stems,
+            )
 
             model_name = bl_map_collision.export_name
             if not LOOSE_HKX_COLLISION_STEM_RE.match(model_name):
@@ -324,42 +335,71 @@ class ExportHKXMapCollisionIntoHKXBHD(LoggingOperator):
                         f"anyway."
                     )
 
-            try:
-                hi_hkx, lo_hkx = bl_map_collision.to_hkx_pair(self, require_hi=True, use_hi_if_missing_lo=True)
-            except Exception as ex:
-                traceback.print_exc()
-                self.error(f"Cannot get exported hi/lo HKX for '{bl_map_collision.name}'. Error: {ex}")
-                continue
-            hi_hkx.dcx_type = dcx_type
-            lo_hkx.dcx_type = dcx_type
-
-            if map_stem not in opened_both_res_hkxbhds:
-                for res in ("h", "l"):
-                    for suffix in ("hkxbhd", "hkxbdt"):
-                        relative_path = Path(f"map/{map_stem}/{res}{map_stem[1:]}.{suffix}")
-                        try:
-                            settings.prepare_project_file(relative_path, must_exist=True)
-                        except FileNotFoundError as ex:
-                            return self.error(
-                                f"Could not find file '{relative_path}' for map '{map_stem}'. Error: {ex}"
-                            )
+            export_items_by_map_stem.setdefault(map_stem, []).append((bl_map_collision, model_name))
+
+        # Prepare and open the HKXBHDs of each unique destination map exactly once, before any (slow) HKX conversion,
+        # so that a missing map file is reported without wasting that work.
+        map_dirs = {}  # type: dict[str, Path]  # keys are map stems
+        for map_stem in export_items_by_map_stem:
+            for res in ("h", "l"):
+                for relative_path in get_relative_hkxbhd_hkxbdt_paths(map_stem, res):
+                    try:
+                        settings.prepare_project_file(relative_path, must_exist=True)
+                    except FileNotFoundError as ex:
+                        return self.error(
+                            f"Could not find file '{relative_path}' for map '{map_stem}'. Error: {ex}"
+                        )
 
+            try:
+                map_dir = settings.get_import_map_dir_path(map_stem=map_stem)
+            except NotADirectoryError:
+                return self.error(f"Could not find map data directory for map '{map_stem}'.")
+            map_dirs[map_stem] = map_dir
+
+        # Binder reads are mostly file I/O, so the HKXBHDs of all destination maps are opened concurrently.
+        with ThreadPoolExecutor(max_workers=len(map_dirs) or 1) as executor:
+            opened_both_res_hkxbhds = dict(
+                zip(map_dirs, executor.map(BothResHKXBHD.from_map_path, map_dirs.values()))
+            )  # type: dict[str, BothResHKXBHD]  # keys are map stems
+
+        # Second pass: convert and add HKXs to their opened HKXBHDs, one map at a time. Object Mode is set once here,
+        # so that any mesh edits are flushed to mesh data before reading it.
+        self.to_object_mode()
+        scratch_arrays = {}  # `foreach_get` read buffers reused for all collision meshes in this export
+        exported_map_stems = set()  # only maps that received at least one HKX pair are written
+        for map_stem, export_items in export_items_by_map_stem.items():
+            both_res_hkxbhd = opened_both_res_hkxbhds[map_stem]
+            for bl_map_collision, model_name in export_items:
                 try:
-                    map_dir = settings.get_import_map_dir_path(map_stem=map_stem)
-                except NotADirectoryError:
-                    return self.error(f"Could not find map data directory for map '{map_stem}'.")
-                opened_both_res_hkxbhds[map_stem] = BothResHKXBHD.from_map_path(map_dir)
-
-            opened_both_res_hkxbhds[map_stem].hi_res.set_hkx(hi_hkx.path_stem, hi_hkx)
-            opened_both_res_hkxbhds[map_stem].lo_res.set_hkx(lo_hkx.path_stem, lo_hkx)
-            self.info(f"Added hi-res and lo-res HKX for {model_name} to {map_stem} HKXBHDs.")
-
+                    hi_hkx, lo_hkx = bl_map_collision.to_hkx_pair(
+                        self, require_hi=True, use_hi_if_missing_lo=True, scratch_arrays=scratch_arrays
+                    )
+                except Exception as ex:
+                    self.print_debug_traceback()
+                    self.error(f"Cannot get exported hi/lo HKX for '{bl_map_collision.name}'. Error: {ex}")
+                    continue
+                hi_hkx.dcx_type = dcx_type
+                lo_hkx.dcx_type = dcx_type
+
+                both_res_hkxbhd.hi_res.set_hkx(hi_hkx.path_stem, hi_hkx)
+                both_res_hkxbhd.lo_res.set_hkx(lo_hkx.path_stem, lo_hkx)
+                exported_map_stems.add(map_stem)
+                self.info(f"Added hi-res and lo-res HKX for {model_name} to {map_stem} HKXBHDs.")
+
+        if not exported_map_stems:
+            return {"CANCELLED"}
+
+        # All modified HKXBHDs (hi and lo, for every map) are written concurrently.
+        hkxbhds_and_relative_paths = []  # type: list[tuple[HKXBHD, Path]]
         for map_stem, both_res_hkxbhd in opened_both_res_hkxbhds.items():
-            return_strings |= settings.export_file(
-                self, both_res_hkxbhd.hi_res, Path(f"map/{map_stem}/h{map_stem[1:]}.hkxbhd")
+            if map_stem not in exported_map_stems:
+                continue
+            hkxbhds_and_relative_paths.append(
+                (both_res_hkxbhd.hi_res, get_relative_hkxbhd_hkxbdt_paths(map_stem, "h")[0])
             )
-            return_strings |= settings.export_file(
-                self, both_res_hkxbhd.lo_res, Path(f"map/{map_stem}/l{map_stem[1:]}.hkxbhd")
+            hkxbhds_and_relative_paths.append(
+                (both_res_hkxbhd.lo_res, get_relative_hkxbhd_hkxbdt_paths(map_stem, "l")[0])
             )
+        return_strings |= settings.export_files(self, hkxbhds_and_relative_paths)
 
         return {"FINISHED"} if "FINISHED" in return_strings else {"CANCELLED"}  # at least one success
@@ -36,32 +36,38 @@ class MapCollisionImportExportPanel(bpy.types.Panel):
         layout = self.layout
         map_stem_box(layout, settings)
 
-        import_box = layout.box()
-        import_box.label(text="Import from Game/Project:")
-        import_box.operator(ImportSelectedMapHKXMapCollision.bl_idname)
-        import_box.label(text="Generic Import:")
-        import_box.operator(ImportHKXMapCollision.bl_idname, text="Import Any Map Collision")
-
-        export_box = self.layout.box()
+        header, panel = layout.panel("Import", default_closed=True)
+        header.label(text="Import")
+        if panel:
+            panel.label(text="Import from Game/Project:")
+            panel.operator(ImportSelectedMapHKXMapCollision.bl_idname)
+            panel.label(text="Generic Import:")
+            panel.operator(ImportHKXMapCollision.bl_idname, text="Import Any Map Collision")
+
+        header, panel = layout.panel("Export", default_closed=True)
+        header.label(text="Export")
+        if not panel:
+            # Collapsed: skip the selected collision check below, which walks all selected objects.
+            return
 
         # TODO: Haven't done final tests on HKX packfiles for PTDE collision export.
         if not settings.is_game("DARK_SOULS_DSR"):
-            export_box.label(text="Export supported for DSR only.")
+            panel.label(text="Export supported for DSR only.")
             return
 
         try:
             BlenderMapCollision.from_selected_objects(context)
         except SoulstructTypeError:
-            export_box.label(text="Select some Collision models.")
-            export_box.label(text="MSB Parts cannot be selected.")
+            panel.label(text="Select some Collision models.")
+            panel.label(text="MSB Parts cannot be selected.")
             return
 
-        export_box.prop(context.scene.soulstruct_settings, "detect_map_from_collection")
-        export_box.label(text="Export to Game/Project:")
-        export_box.operator(ExportHKXMapCollisionIntoHKXBHD.bl_idname)
-        export_box.label(text="Generic Export:")
-        export_box.operator(ExportLooseHKXMapCollision.bl_idname)
-        export_box.operator(ExportHKXMapCollisionIntoBinder.bl_idname)
+        panel.prop(settings, "detect_map_from_collection")
+        panel.label(text="Export to Game/Project:")
+        panel.operator(ExportHKXMapCollisionIntoHKXBHD.bl_idname)
+        panel.label(text="Generic Export:")
+        panel.operator(ExportLooseHKXMapCollision.bl_idname)
+        panel.operator(ExportHKXMapCollisionIntoBinder.bl_idname)
 
 
 class MapCollisionToolsPanel(bpy.types.Panel):
@@ -6,6 +6,7 @@ __all__ = [
 ]
 
 import bpy
+import numpy as np
 
 from io_soulstruct.utilities.operators import LoggingOperator
 
@@ -26,9 +27,7 @@ class SelectHiResFaces(LoggingOperator):
         bpy.ops.object.mode_set(mode="OBJECT")
         if obj.type != "MESH":
             return self.error("Selected object is not a mesh.")
-        for face in obj.data.polygons:
-            if "(Hi)" in obj.data.materials[face.material_index].name:
-                face.select = True
+        _select_faces_with_material_name(obj, "(Hi)")
         bpy.ops.object.mode_set(mode="EDIT")
         return {"FINISHED"}
 
@@ -49,8 +48,28 @@ class SelectLoResFaces(LoggingOperator):
         bpy.ops.object.mode_set(mode="OBJECT")
         if obj.type != "MESH":
             return self.error("Selected object is not a mesh.")
-        for face in obj.data.polygons:
-            if "(Lo)" in obj.data.materials[face.material_index].name:
-                face.select = True
+        _select_faces_with_material_name(obj, "(Lo)")
         bpy.ops.object.mode_set(mode="EDIT")
         return {"FINISHED"}
+
+
+def _select_faces_with_material_name(obj: bpy.types.MeshObject, name_substring: str):
+    """Select all faces of `obj` (in Object Mode) whose material name contains `name_substring`.
+
+    Material names are checked once per slot rather than once per face, and face selection is read and written in bulk.
+    Faces that are already selected stay selected.
+    """
+    mesh = obj.data
+    slot_matches = np.array(
+        [material is not None and name_substring in material.name for material in mesh.materials] or [False],
+        dtype=bool,
+    )
+    face_material_indices = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", face_material_indices)
+    # Out-of-range indices (more than the slot count) are clamped to the last slot, as Blender does when drawing.
+    np.clip(face_material_indices, 0, len(slot_matches) - 1, out=face_material_indices)
+    # Matching faces are added to the existing selection; no faces are deselected.
+    face_selection = np.empty(len(mesh.polygons), dtype=bool)
+    mesh.polygons.foreach_get("select", face_selection)
+    face_selection |= slot_matches[face_material_indices]
+    mesh.polygons.foreach_set("select", face_selection)
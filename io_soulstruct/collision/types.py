@@ -21,6 +21,19 @@ from .properties import MapCollisionProps
 from .utilities import HKX_MATERIAL_NAME_RE
 
 
+def _get_scratch_array(
+    scratch_arrays: dict[str, np.ndarray], key: str, size: int, dtype: type[np.number]
+) -> np.ndarray:
+    """Get a `size`-length view of the reusable scratch array `key` in `scratch_arrays`, growing it if necessary.
+
+    Contents are undefined, and the view is only valid until the next call with the same `key`.
+    """
+    array = scratch_arrays.get(key)
+    if array is None or array.size < size:
+        array = scratch_arrays[key] = np.empty(size, dtype=dtype)
+    return array[:size]
+
+
 class BlenderMapCollision(SoulstructObject[MapCollisionModel, MapCollisionProps]):
 
     TYPE = SoulstructType.COLLISION
@@ -128,6 +141,7 @@ class BlenderMapCollision(SoulstructObject[MapCollisionModel, MapCollisionProps]
         hi_name="",
         lo_name="",
         py_havok_module=PyHavokModule.hk2015,
+        scratch_arrays: dict[str, np.ndarray] | None = None,
     ) -> tuple[MapCollisionModel | None, MapCollisionModel | None]:
         """Create 'hi' and/or 'lo' HKX files by splitting given `hkx_model` into submeshes by material, or (if empty),
         directly from child submesh Mesh objects.
@@ -135,8 +149,13 @@ class BlenderMapCollision(SoulstructObject[MapCollisionModel, MapCollisionProps]
         `hi_name` and `lo_name` are required to set internally to the HKX file (though it probably doesn't impact
         gameplay). If passed explicitly as `None`, those submeshes will be ignored -- but they cannot BOTH be `None`.
 
+        `scratch_arrays` can be passed by operators that export many collisions, so that the same `foreach_get` read
+        buffers are reused for every mesh (and freed once the operator is done with the dictionary).
+
         TODO: Currently only supported for DS1R (Havok 2015).
         """
+        if scratch_arrays is None:
+            scratch_arrays = {}
         if not self.obj.material_slots:
             raise ValueError(f"HKX model mesh '{self.name}' has no materials for submesh detection.")
 
@@ -150,44 +169,65 @@ class BlenderMapCollision(SoulstructObject[MapCollisionModel, MapCollisionProps]
         else:
             raise ValueError(f"Name of Map Collision model mesh '{self.name}' does not start with 'h' or 'l'.")
 
-        # Automatically triangulate the mesh.
+        # Automatically triangulate the mesh, unless it is already fully triangulated (usually true for imported HKX
+        # meshes), in which case we can read its data directly without creating a temporary copy.
         self._clear_temp_hkx()
-        bm = bmesh.new()
-        bm.from_mesh(self.obj.data)
-        bmesh.ops.triangulate(bm, faces=bm.faces, quad_method="BEAUTY", ngon_method="BEAUTY")
-        tri_mesh_data = bpy.data.meshes.new("__TEMP_HKX__")
-        # No need to copy materials over (no UV, etc.)
-        bm.to_mesh(tri_mesh_data)
-        bm.free()
-        del bm
+        face_loop_totals = _get_scratch_array(scratch_arrays, "loop_total", len(self.data.polygons), np.int32)
+        self.data.polygons.foreach_get("loop_total", face_loop_totals)
+        if np.all(face_loop_totals == 3):
+            tri_mesh_data = self.data
+        else:
+            bm = bmesh.new()
+            bm.from_mesh(self.data)
+            bmesh.ops.triangulate(bm, faces=bm.faces, quad_method="BEAUTY", ngon_method="BEAUTY")
+            tri_mesh_data = bpy.data.meshes.new("__TEMP_HKX__")
+            # No need to copy materials over (no UV, etc.)
+            bm.to_mesh(tri_mesh_data)
+            bm.free()
+            del bm
 
         hi_hkx_meshes = []  # type: list[MapCollisionModelMesh]
         lo_hkx_meshes = []  # type: list[MapCollisionModelMesh]
 
-        # Note that it is possible that the user may have faces with different materials share vertices; this is fine,
-        # and that vertex will be copied into each HKX submesh with a face loop that uses it.
+        # Read all vertex, face, and material data in bulk. Every face is now a triangle, so loop vertex indices reshape
+        # directly into face rows.
+        vertex_count = len(tri_mesh_data.vertices)
+        face_count = len(tri_mesh_data.polygons)
+        if len(tri_mesh_data.loops) != 3 * face_count:
+            raise MapCollisionExportError(f"Mesh '{self.name}' could not be fully triangulated for HKX export.")
+        vertex_coords = _get_scratch_array(scratch_arrays, "co", vertex_count * 3, np.float32)
+        tri_mesh_data.vertices.foreach_get("co", vertex_coords)
+        vertex_coords = vertex_coords.reshape(-1, 3)[:, (0, 2, 1)]  # swap Y and Z (also copies out of scratch array)
+        face_vertex_indices = _get_scratch_array(scratch_arrays, "vertex_index", face_count * 3, np.int32)
+        tri_mesh_data.loops.foreach_get("vertex_index", face_vertex_indices)
+        face_vertex_indices = face_vertex_indices.reshape(-1, 3)
+        face_material_indices = _get_scratch_array(scratch_arrays, "material_index", face_count, np.int32)
+        tri_mesh_data.polygons.foreach_get("material_index", face_material_indices)
+
+        bad_face_indices = np.flatnonzero(face_material_indices >= len(self.obj.material_slots))
+        if bad_face_indices.size:
+            bad_face_index = bad_face_indices[0]
+            raise MapCollisionExportError(
+                f"Face {bad_face_index} of mesh '{self.name}' has material index "
+                f"{face_material_indices[bad_face_index]}, which is not in the material slots of the mesh."
+            )
 
-        # Rather than iterating over all faces once for every material, we iterate over all of them once to split them
-        # up by material index, then iterate once over each of those sublists (so the full face list is iterated twice).
-        faces_by_material = {i: [] for i in range(len(self.obj.material_slots))}
-        for face in tri_mesh_data.polygons:
-            try:
-                faces_by_material[face.material_index].append(face)
-            except KeyError:
-                raise MapCollisionExportError(
-                    f"Face {face.index} of mesh '{self.name}' has material index {face.material_index}, "
-                    f"which is not in the material slots of the mesh."
-                )
+        # Group faces by material with one stable sort, rather than masking the full face array once per material. Both
+        # 'hi' and 'lo' submeshes are split from this single pass. Unused materials do not appear at all.
+        face_order = np.argsort(face_material_indices, kind="stable")
+        used_bl_material_indices, material_face_starts = np.unique(
+            face_material_indices[face_order], return_index=True
+        )
+        faces_by_material = np.split(face_vertex_indices[face_order], material_face_starts[1:]) if face_count else []
 
-        # Now iterate over each sublist of faces and create lists of HKX vertices and faces for each one. We maintain
-        # a vertex map that maps the original full-mesh Blender vertex index to the submesh index.
-        for bl_material_index, faces in faces_by_material.items():
-            if not faces:
-                continue  # no faces use this material
+        # Note that it is possible that the user may have faces with different materials share vertices; this is fine,
+        # and that vertex will be copied into each HKX submesh with a face loop that uses it.
+        submesh_sources = []  # type: list[tuple[str, int, np.ndarray, np.ndarray]]
+        for bl_material_index, material_faces in zip(used_bl_material_indices, faces_by_material, strict=True):
 
             # Extract HKX material index from name of Blender material.
             # We can use the original non-triangulated mesh's material slots.
-            bl_material = self.obj.material_slots[bl_material_index].material
+            bl_material = self.obj.material_slots[int(bl_material_index)].material
             mat_match = HKX_MATERIAL_NAME_RE.match(bl_material.name)
             if not mat_match:
                 raise MapCollisionExportError(
@@ -199,31 +239,28 @@ class BlenderMapCollision(SoulstructObject[MapCollisionModel, MapCollisionProps]
             if (res == "h" and not hi_name) or (res == "l" and not lo_name):
                 continue  # ignoring resolution
 
-            # We can't assume that all faces with the same material index - and the vertices they use - are contiguous
-            # in `polygons`, so a simple global vertex index subtraction won't work. We need to maintain a vertex map.
-            vertex_map = {}
-            hkx_verts_list = []
-            hkx_faces_list = []
-            for face in faces:
-                hkx_face = []
-                for vert_index in face.vertices:
-                    if vert_index not in vertex_map:
-                        # First time this vertex has been used by this submesh.
-                        hkx_vert_index = vertex_map[vert_index] = len(hkx_verts_list)
-                        vert = tri_mesh_data.vertices[vert_index]
-                        hkx_verts_list.append(
-                            [vert.co.x, vert.co.z, vert.co.y]  # may as well swap Y and Z coordinates here
-                        )
-                    else:
-                        # Vertex has already been used by this submesh.
-                        hkx_vert_index = vertex_map[vert_index]
-                    hkx_face.append(hkx_vert_index)
-                hkx_faces_list.append(hkx_face)
+            # Faces with the same material - and the vertices they use - need not be contiguous, so we keep only the
+            # vertices used by this submesh and remap face indices into that subset.
+            used_vertex_indices, submesh_face_indices = np.unique(material_faces, return_inverse=True)
+            submesh_sources.append((res, hkx_material_index, used_vertex_indices, submesh_face_indices.reshape(-1, 3)))
+
+        # All submesh vertices and faces are written into one array each, and every submesh receives contiguous slices
+        # of them, rather than allocating two new arrays per submesh.
+        all_vertices = np.empty((sum(len(source[2]) for source in submesh_sources), 3), dtype=np.float32)
+        all_faces = np.empty((sum(len(source[3]) for source in submesh_sources), 3), dtype=np.uint32)
+        vertex_offset = face_offset = 0
+        for res, hkx_material_index, used_vertex_indices, submesh_face_indices in submesh_sources:
+            submesh_vertices = all_vertices[vertex_offset:vertex_offset + len(used_vertex_indices)]
+            np.take(vertex_coords, used_vertex_indices, axis=0, out=submesh_vertices)
+            vertex_offset += len(used_vertex_indices)
+            submesh_faces = all_faces[face_offset:face_offset + len(submesh_face_indices)]
+            submesh_faces[:] = submesh_face_indices  # TODO: why not native uint16?
+            face_offset += len(submesh_face_indices)
 
             meshes = hi_hkx_meshes if res == "h" else lo_hkx_meshes
             mesh = MapCollisionModelMesh(
-                vertices=np.array(hkx_verts_list, dtype=np.float32),
-                faces=np.array(hkx_faces_list, dtype=np.uint32),  # TODO: why not native uint16?
+                vertices=submesh_vertices,
+                faces=submesh_faces,
                 material_index=hkx_material_index,
             )
             meshes.append(mesh)
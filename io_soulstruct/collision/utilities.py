@@ -2,9 +2,23 @@ from __future__ import annotations
 
 __all__ = [
     "HKX_MATERIAL_NAME_RE",
+    "get_relative_hkxbhd_hkxbdt_paths",
 ]
 
 import re
+from functools import cache
+from pathlib import Path
 
 
 HKX_MATERIAL_NAME_RE = re.compile(r"HKX (?P<index>\d+) \((?P<res>Hi|Lo)\).*")  # Blender HKX material name
+
+
+@cache
+def get_relative_hkxbhd_hkxbdt_paths(map_stem: str, res: str) -> tuple[Path, Path]:
+    """Get relative `(hkxbhd_path, hkxbdt_path)` of resolution `res` ('h' or 'l') for `map_stem`.
+
+    Cached, as export operators request the same few paths repeatedly.
+    """
+    map_dir = Path("map", map_stem)
+    binder_stem = f"{res}{map_stem[1:]}"
+    return map_dir / f"{binder_stem}.hkxbhd", map_dir / f"{binder_stem}.hkxbdt"
@@ -121,7 +121,7 @@ class ImportHKXCutscene(LoggingOperator, ImportHelper):
                         self, context, msb_part, part_name, part_collection, map_stem
                     )
                 except Exception as ex:
-                    traceback.print_exc()
+                    self.print_debug_traceback()
                     self.error(f"Failed to import MSB {bl_part_type.PART_SUBTYPE} {msb_part.name}' for cutscene: {ex}")
                     continue
             bl_cutscene_parts[part_name] = bl_part
@@ -142,7 +142,7 @@ class ImportHKXCutscene(LoggingOperator, ImportHelper):
             first_cut_frames = next(iter(remo_part.cut_arma_frames.values()))
             track_bone_names = list(first_cut_frames[0].keys())
 
-            bl_bone_names = [b.name for b in bl_part.armature.data.bones]
+            bl_bone_names = {b.name for b in bl_part.armature.data.bones}
             # Check that all cutscene part bone names are present in Blender Armature.
             # We ignore the FLVER 'master' bone, which does not appear in cutscene data (it's replaced by the
             # root of the amalgamated cutscene 'skeleton').
@@ -94,7 +94,7 @@ class FLVERModelToolsPanel(bpy.types.Panel):
         header, panel = layout.panel("UV Tools", default_closed=True)
         header.label(text="UV Tools")
         if panel:
-            panel.prop(context.scene.flver_tool_settings, "uv_scale")
+            panel.prop(flver_tool_settings, "uv_scale")
             panel.operator(FastUVUnwrap.bl_idname)
 
         header, panel = layout.panel("Vertex Color Tools", default_closed=True)
@@ -110,8 +110,8 @@ class FLVERModelToolsPanel(bpy.types.Panel):
         header, panel = layout.panel("Dummy Tools", default_closed=True)
         header.label(text="Dummy Tools")
         if panel:
-            panel.prop(context.scene.flver_tool_settings, "dummy_id_draw_enabled", text="Draw Dummy IDs")
-            panel.prop(context.scene.flver_tool_settings, "dummy_id_font_size", text="Dummy ID Font Size")
+            panel.prop(flver_tool_settings, "dummy_id_draw_enabled", text="Draw Dummy IDs")
+            panel.prop(flver_tool_settings, "dummy_id_font_size", text="Dummy ID Font Size")
             panel.operator(HideAllDummiesOperator.bl_idname)
             panel.operator(ShowAllDummiesOperator.bl_idname)
 
@@ -119,7 +119,7 @@ class FLVERModelToolsPanel(bpy.types.Panel):
         header.label(text="Other Tools")
         if panel:
             box = panel.box()
-            box.prop(context.scene.soulstruct_settings, "new_model_name")
+            box.prop(settings, "new_model_name")
             box.operator(RenameFLVER.bl_idname)
 
             panel.operator(PrintGameTransform.bl_idname)
@@ -8,7 +8,7 @@ __all__ = [
 from pathlib import Path
 
 import bpy
-from soulstruct.containers import Binder
+from soulstruct.containers import Binder, BinderEntry
 from soulstruct.containers.tpf import TPF
 from soulstruct.dcx import DCXType
 from io_soulstruct.utilities import *
@@ -105,11 +105,11 @@ class ExportTexturesIntoBinderOrTPF(LoggingImportOperator):
     def poll(cls, context):
         try:
             # TODO: What if you just want to export an image from the Image Viewer? Different operator?
-            sel_tex_nodes = [
-                node for node in context.active_object.active_material.node_tree.nodes
-                if node.select and node.bl_idname == "ShaderNodeTexImage"
-            ]
-            return bool(sel_tex_nodes)
+            # Stops at first selected Image Texture node (called on every redraw).
+            return any(
+                node.select and node.bl_idname == "ShaderNodeTexImage"
+                for node in context.active_object.active_material.node_tree.nodes
+            )
         except (AttributeError, IndexError):
             return False
 
@@ -137,12 +137,8 @@ class ExportTexturesIntoBinderOrTPF(LoggingImportOperator):
         #   - a Binder with multiple single-texture TPFs
         try:
             if self.filepath.endswith(".tpf") or self.filepath.endswith(".tpf.dcx"):
-                # Put texture into loose TPF.
-                tpf = TPF.from_path(self.filepath)
-                binder = None
-                # No DCX.
+                return self.error("Export into loose TPF is not supported yet.")
             else:
-                tpf = None
                 binder = Binder.from_path(self.filepath)
                 if binder.dcx_type == DCXType.Null:
                     # Apply appropriate TPF compression inside uncompressed Binder.
@@ -150,6 +146,7 @@ class ExportTexturesIntoBinderOrTPF(LoggingImportOperator):
         except Exception as ex:
             return self.error(f"Error occurred when trying to read '{self.filepath}' as a TPF or Binder:\n  {str(ex)}")
 
+        dds_textures = DDSTextureCollection()
         for tex_node in sel_tex_nodes:
 
             if not tex_node.image:
@@ -160,31 +157,34 @@ class ExportTexturesIntoBinderOrTPF(LoggingImportOperator):
                 self.warning("Ignoring Image Texture node with a placeholder 1x1 image assigned.")
                 continue
 
-            dds_texture = DDSTexture(tex_node.image)
-
-            target_tpf = tpf  # could be None
-            if binder is not None:
-                for entry in binder.entries:
-                    if entry.name.endswith((".tpf", ".tpf.dcx")):
-                        if entry.minimal_stem == dds_texture.stem:
-                            # Found a single-texture TPF matching this texture stem. Replace in entry.
-                            new_tpf = dds_texture.to_single_texture_tpf(
-                                self,
-                                dcx_type,
-                                lambda _stem: entry.to_binary_file(TPF).textures[0].get_dds().texconv_format,
-                            )
-                            entry.set_from_binary_file(new_tpf)
-                            break
-                        elif entry.minimal_stem == binder.path_minimal_stem:
-                            # Found a multi-texture TPF. Treat as target TPF.
-                            target_tpf = entry.to_binary_file(TPF)
-                else:
-                    # Create new single-texture TPF entry.
-                    new_tpf = dds_texture.to_single_texture_tpf(
-                        self,
-                        dcx_type,
-                        find_same_format=None,  # cannot resolve 'SAME' DDS format
-                    )
-                    # TODO
+            dds_textures.add(DDSTexture(tex_node.image))
+
+        if binder is not None:
+            # Index Binder TPF entries by stem once, rather than scanning all entries for every texture. The first entry
+            # with a given stem is used.
+            tpf_entries_by_stem: dict[str, BinderEntry] = {}
+            for entry in binder.entries:
+                if entry.name.endswith((".tpf", ".tpf.dcx")):
+                    tpf_entries_by_stem.setdefault(entry.minimal_stem, entry)
+
+            # Found single-texture TPFs matching texture stems are replaced. All of these textures are converted to DDS
+            # in one batch, and each entry is only set once.
+            replaced_textures = DDSTextureCollection()
+            for stem, dds_texture in dds_textures.items():
+                if stem in tpf_entries_by_stem:
+                    replaced_textures[stem] = dds_texture
+                    continue
+                # TODO
+                self.warning(f"No existing single-texture TPF found in Binder for texture '{stem}'. Not exported.")
+
+            if replaced_textures:
+
+                def find_same_format(_stem: str) -> str:
+                    return tpf_entries_by_stem[_stem].to_binary_file(TPF).textures[0].get_dds().texconv_format
+
+                new_tpfs = replaced_textures.to_single_texture_tpfs(self, dcx_type, find_same_format)
+                for dds_texture, new_tpf in zip(replaced_textures.get_sorted_textures(), new_tpfs):
+                    if new_tpf is not None:  # error already reported otherwise
+                        tpf_entries_by_stem[dds_texture.stem].set_from_binary_file(new_tpf)
 
         return {"FINISHED"}
@@ -263,7 +263,7 @@ class ImageImportManager:
                 binder_stem = lower_stem(tpf_or_tpfbhd_path)
                 if tpf_or_tpfbhd_path not in self._scanned_binder_paths:
                     self._binder_paths.setdefault(binder_stem, tpf_or_tpfbhd_path)
-            elif TPF_RE.match(tpf_or_tpfbhd_path.name):
+            elif tpf_or_tpfbhd_path.name.endswith((".tpf", ".tpf.dcx")):
                 # Loose map multi-texture TPF (usually 'mXX_9999.tpf'). We unpack all textures in it immediately.
                 tpf_stem = lower_stem(tpf_or_tpfbhd_path)
                 if tpf_stem not in self._scanned_tpf_sources:
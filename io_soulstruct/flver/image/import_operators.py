@@ -6,10 +6,13 @@ __all__ = [
     "batch_get_tpf_texture_tga_data",
 ]
 
+import hashlib
 import logging
-import re
+import os
+import shutil
 import tempfile
 import typing as tp
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import bpy
@@ -22,9 +25,23 @@ from .types import *
 
 _LOGGER = logging.getLogger(__name__)
 
-TPF_RE = re.compile(r"(?P<stem>.*)\.tpf(?P<dcx>\.dcx)?$")
-CHRTPFBHD_RE = re.compile(r"(?P<stem>.*)\.chrtpfbhd?$")  # never has DCX
-AEG_STEM_RE = re.compile(r"^aeg(?P<aeg>\d\d\d)$")  # checks stem only
+TPF_SUFFIXES = (".tpf", ".tpf.dcx")  # checked with `str.endswith()` rather than a regex
+
+# Subdirectory of image cache directory where converted DDS textures are cached by DDS content hash.
+DDS_HASH_CACHE_SUBDIR = "dds_hash_cache"
+
+
+def _get_dds_hash_cache_path(cache_dir: Path, dds_data: bytes | Path, image_format: str) -> Path:
+    """Get path of converted image of `dds_data` in `cache_dir`, keyed by DDS content rather than texture name.
+
+    If `dds_data` is a DDS file path, the file is hashed in chunks rather than being read into memory all at once.
+    """
+    if isinstance(dds_data, Path):
+        with dds_data.open("rb") as f:
+            dds_hash = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16))
+    else:
+        dds_hash = hashlib.blake2b(dds_data, digest_size=16)
+    return cache_dir / f"{dds_hash.hexdigest()}.{image_format.lower()}"
 
 
 # NOTE: We don't need a PropertyGroup for texture import (yet).
@@ -101,21 +118,30 @@ class ImportTextures(LoggingImportOperator):
 
     def execute(self, context):
 
-        # TODO: Respect general image cache settings, including optional data pack.
         settings = context.scene.soulstruct_settings
 
+        # Previously converted DDS textures are read/written by content hash, if image cache directory is set.
+        read_cache_dir = write_cache_dir = None
+        if settings.image_cache_directory:
+            hash_cache_dir = settings.image_cache_directory / DDS_HASH_CACHE_SUBDIR
+            if settings.read_cached_images:
+                read_cache_dir = hash_cache_dir
+            if settings.write_cached_images:
+                hash_cache_dir.mkdir(parents=True, exist_ok=True)
+                write_cache_dir = hash_cache_dir
+
         texture_collection = DDSTextureCollection()
+        dds_paths = []  # type: list[Path]
 
         for file_path in self.file_paths:
 
-            if TPF_RE.match(file_path.name):
-                texture_collection |= self.import_tpf(file_path, settings.image_cache_format)
+            if file_path.name.endswith(TPF_SUFFIXES):
+                texture_collection |= self.import_tpf(
+                    file_path, settings.image_cache_format, read_cache_dir, write_cache_dir, settings.pack_image_data
+                )
             elif file_path.suffix == ".dds":
-                # Loose DDS file.
-                try:
-                    texture_collection |= self.import_dds(file_path, settings.image_cache_format)
-                except Exception as ex:
-                    self.warning(f"Could not import DDS file into Blender: {ex}")
+                # Loose DDS file. Converted in one batch below.
+                dds_paths.append(file_path)
             else:
                 # Try native file format. File browser filter should prevent non-image files.
                 try:
@@ -123,6 +149,14 @@ class ImportTextures(LoggingImportOperator):
                 except Exception as ex:
                     self.warning(f"Could not import image file '{file_path.name}' into Blender: {ex}")
 
+        if dds_paths:
+            try:
+                texture_collection |= self.import_dds_batch(
+                    dds_paths, settings.image_cache_format, read_cache_dir, write_cache_dir, settings.pack_image_data
+                )
+            except Exception as ex:
+                self.warning(f"Could not import DDS files into Blender: {ex}")
+
         if not texture_collection:
             self.warning("No textures could be imported.")
             return {"CANCELLED"}
@@ -227,7 +261,19 @@ class ImportTextures(LoggingImportOperator):
 
         return {"FINISHED"}
 
-    def import_tpf(self, tpf_path: Path, image_format: str) -> dict[str, DDSTexture]:
+    def import_tpf(
+        self,
+        tpf_path: Path,
+        image_format: str,
+        read_cache_dir: Path | None = None,
+        write_cache_dir: Path | None = None,
+        pack_cached_images=True,
+    ) -> dict[str, DDSTexture]:
+        """Import all textures in TPF. Textures found in `read_cache_dir` (by DDS content hash) are not converted.
+
+        Newly converted textures are always packed into the `.blend` file. Cached textures are only packed if
+        `pack_cached_images` is True; otherwise, they link to the cached image file.
+        """
         tpf = TPF.from_path(tpf_path)
         if self.image_node_assignment_mode == "SIMPLE_TEXTURE" and len(tpf.textures) > 1:
             self.info(
@@ -236,16 +282,42 @@ class ImportTextures(LoggingImportOperator):
             return {}
 
         if image_format == "TGA":
-            textures_image_data = batch_get_tpf_texture_tga_data(tpf.textures)
+            batch_get_image_data = batch_get_tpf_texture_tga_data
         elif image_format == "PNG":
-            textures_image_data = batch_get_tpf_texture_png_data(tpf.textures)
+            batch_get_image_data = batch_get_tpf_texture_png_data
         else:
             raise ValueError(f"Unsupported image format: {image_format}")
-        self.info(f"Loaded {len(textures_image_data)} texture(s) from TPF: {tpf_path.name}")
+
         texture_images = {}
+        textures_image_data = [None] * len(tpf.textures)  # type: list[bytes | None]
+        uncached_indices = []
+        for i, texture in enumerate(tpf.textures):
+            if read_cache_dir:
+                cached_path = _get_dds_hash_cache_path(read_cache_dir, texture.data, image_format)
+                if cached_path.is_file():
+                    # Loaded straight from cache file, rather than reading its data and writing it out again.
+                    texture_name = texture.name.lower()
+                    texture_images[texture_name] = self._load_hash_cached_image(
+                        cached_path,
+                        f"{texture_name}.{image_format.lower()}",
+                        pack_cached_images,
+                        replace_existing=self.overwrite_existing,
+                    )
+                    continue
+            uncached_indices.append(i)
+
+        if uncached_indices:
+            converted_image_data = batch_get_image_data([tpf.textures[i] for i in uncached_indices])
+            for i, image_data in zip(uncached_indices, converted_image_data):
+                textures_image_data[i] = image_data
+                if write_cache_dir and image_data is not None:
+                    cache_path = _get_dds_hash_cache_path(write_cache_dir, tpf.textures[i].data, image_format)
+                    cache_path.write_bytes(image_data)
+
+        self.info(f"Loaded {len(tpf.textures)} texture(s) from TPF: {tpf_path.name}")
         for texture, image_data in zip(tpf.textures, textures_image_data):
             if image_data is None:
-                continue  # failed to convert this texture
+                continue  # cached or failed to convert this texture
             try:
                 bl_image = DDSTexture.new_from_image_data(
                     self, texture.name.lower(), image_format, image_data, replace_existing=self.overwrite_existing
@@ -256,34 +328,134 @@ class ImportTextures(LoggingImportOperator):
             texture_images[texture.name.lower()] = bl_image
         return texture_images
 
-    def import_dds(self, dds_path: Path, image_format: str) -> dict[str, DDSTexture]:
+    def import_dds_batch(
+        self,
+        dds_paths: list[Path],
+        image_format: str,
+        read_cache_dir: Path | None = None,
+        write_cache_dir: Path | None = None,
+        pack_cached_images=True,
+    ) -> dict[str, DDSTexture]:
+        """Convert all given loose DDS files with `texconv` in parallel and load the resulting images.
+
+        Each file gets its own single-threaded `texconv` process (`-singleproc`), with one process running per CPU core
+        at a time. Output files are written to the same temporary directory, so DDS files with duplicate names are
+        skipped. Images are only loaded into Blender (on this thread) after all conversions have finished.
+
+        DDS files whose content hash is found in `read_cache_dir` are loaded from there without conversion. These are
+        only packed into the `.blend` file if `pack_cached_images` is True. Newly converted images are always packed,
+        together, once they have all been loaded.
+        """
+        if image_format not in {"TGA", "PNG"}:
+            raise ValueError(f"Unsupported image format: {image_format}")
+
+        unique_dds_paths = {}  # type: dict[str, Path]
+        for dds_path in dds_paths:
+            image_name = f"{dds_path.stem}.{image_format}".lower()  # Blender Image names kept lower-case
+            if image_name in unique_dds_paths:
+                self.warning(f"Ignoring DDS file with duplicate name: {dds_path}")
+                continue
+            unique_dds_paths[image_name] = dds_path
+
+        texture_images = {}
+
+        dds_hash_cache_paths = {}  # type: dict[str, Path]
+        if read_cache_dir or write_cache_dir:
+            cache_dir = read_cache_dir or write_cache_dir
+            for image_name, dds_path in unique_dds_paths.items():
+                dds_hash_cache_paths[image_name] = _get_dds_hash_cache_path(cache_dir, dds_path, image_format)
+
+        if read_cache_dir:
+            for image_name, cached_path in dds_hash_cache_paths.items():
+                if not cached_path.is_file():
+                    continue
+                dds_path = unique_dds_paths.pop(image_name)
+                try:
+                    texture_images[Path(image_name).stem] = self._load_hash_cached_image(
+                        cached_path, image_name, pack_cached_images, replace_existing=self.overwrite_existing
+                    )
+                except Exception as ex:
+                    self.warning(f"Could not import cached {image_format} of DDS file '{dds_path.name}': {ex}")
+                    continue
+                self.info(f"Loaded cached {image_format} of DDS file: {dds_path.name}")
+            if not unique_dds_paths:
+                return texture_images  # all cached
+
         with tempfile.TemporaryDirectory() as temp_dir:
+            # `texconv` writes converted files to `temp_dir` only, so original DDS files can be passed directly.
+            # NOTE: Threads (not processes) are sufficient here, as each one just waits on its `texconv` subprocess.
+            # Only the top mip level is converted (`-m 1`), as the output image cannot store mipmaps anyway. Existing
+            # output files are overwritten (`-y`) rather than `texconv` failing.
+            texconv_args = (
+                "-singleproc", "-nologo", "-y", "-m", "1", "-o", temp_dir, "-ft", image_format.lower(), "-f", "RGBA"
+            )
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                texconv_results = list(executor.map(
+                    lambda _dds_path: texconv(*texconv_args, _dds_path),
+                    unique_dds_paths.values(),
+                ))
 
-            # Check DDS format for logging.
-            dds = DDS.from_path(dds_path)
-            dds_format = dds.texconv_format
+            loaded_images = []  # type: list[bpy.types.Image]
+            try:
+                for (image_name, dds_path), texconv_result in zip(unique_dds_paths.items(), texconv_results):
+                    image_path = Path(temp_dir, image_name)
+                    if not image_path.is_file():
+                        # Conversion failed.
+                        stdout = texconv_result.stdout.decode()
+                        self.warning(
+                            f"Could not convert texture DDS '{dds_path.name}' to {image_format}:\n    {stdout}"
+                        )
+                        continue
+
+                    try:
+                        if write_cache_dir:
+                            shutil.copyfile(image_path, write_cache_dir / dds_hash_cache_paths[image_name].name)
+                        bl_image = bpy.data.images.load(str(image_path))
+                    except Exception as ex:
+                        self.warning(f"Could not import DDS file '{dds_path.name}' into Blender: {ex}")
+                        continue
+                    loaded_images.append(bl_image)
+                    texture_images[image_path.stem] = DDSTexture(bl_image)
+
+                    # Check DDS format for logging only.
+                    try:
+                        dds_format = DDS.from_path(dds_path).texconv_format
+                    except Exception:
+                        dds_format = "<unknown format>"
+                    self.info(f"Loaded '{dds_format}' DDS file as {image_format}: {dds_path.name}")
+            finally:
+                # Embed images in `.blend` file before temporary directory is deleted.
+                for bl_image in loaded_images:
+                    bl_image.pack()
 
-            temp_dds_path = Path(temp_dir, dds_path.name)
-            temp_dds_path.write_bytes(dds_path.read_bytes())  # write temporary DDS copy
-            if image_format == "TGA":
-                texconv_result = texconv("-o", temp_dir, "-ft", "tga", "-f", "RGBA", "-nologo", temp_dds_path)
-            elif image_format == "PNG":
-                texconv_result = texconv("-o", temp_dir, "-ft", "png", "-f", "RGBA", "-nologo", temp_dds_path)
-            else:
-                raise ValueError(f"Unsupported image format: {image_format}")
-            image_name = f"{dds_path.stem}.{image_format}".lower()  # Blender Image names kept lower-case
-            image_path = Path(temp_dir, dds_path.with_name(image_name))
-            if image_path.is_file():
-                bl_image = bpy.data.images.load(str(image_path))
-                bl_image.pack()  # embed image in `.blend` file
-                self.info(f"Loaded '{dds_format}' DDS file as {image_format}: {dds_path.name}")
-                dds_texture = DDSTexture(bl_image)
-                return {image_path.stem: dds_texture}
-
-            # Conversion failed.
-            stdout = texconv_result.stdout.decode()
-            self.warning(f"Could not convert texture DDS to {image_format}:\n    {stdout}")
-            return {}
+        return texture_images
+
+    @staticmethod
+    def _load_hash_cached_image(
+        cached_path: Path, image_name: str, pack_image_data: bool, replace_existing=False
+    ) -> DDSTexture:
+        """Load (and optionally pack) image from DDS hash cache, renaming it from its hash file name to `image_name`.
+
+        If `replace_existing` is True, an existing Image named `image_name` is reloaded from the cache file instead, as
+        in `DDSTexture.new_from_image_data()`.
+        """
+        try:
+            if not replace_existing:
+                # Go straight to creation below.
+                raise KeyError
+            bl_image = bpy.data.images[image_name]
+        except KeyError:
+            bl_image = bpy.data.images.load(str(cached_path))
+            bl_image.name = image_name
+        else:
+            if bl_image.packed_file:
+                bl_image.unpack(method="USE_ORIGINAL")
+            bl_image.filepath_raw = str(cached_path)
+            bl_image.source = "FILE"
+            bl_image.reload()
+        if pack_image_data:
+            bl_image.pack()  # embed image in `.blend` file
+        return DDSTexture(bl_image)
 
     def import_native(self, image_path: Path) -> dict[str, bpy.types.Image]:
         """Import a non-DDS image file (assumes general Blender support).
@@ -296,7 +468,8 @@ class ImportTextures(LoggingImportOperator):
                 raise KeyError
             bl_image = bpy.data.images[image_path.name.lower()]
         except KeyError:
-            bl_image = bpy.data.images.load(str(image_path))
+            # Reuses existing Image (e.g. with a unique suffix) if this exact file has already been loaded.
+            bl_image = bpy.data.images.load(str(image_path), check_existing=True)
             # NOT packed into `.blend` file.
         else:
             if bl_image.packed_file:
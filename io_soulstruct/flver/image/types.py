@@ -105,10 +105,11 @@ class DDSTexture:
     ) -> DDSTexture:
         """Load Blender Image from image path, and optionally pack image data into Blend file.
 
-        Image can be any supported Blender format.
+        Image can be any supported Blender format. If an Image has already been loaded from the same path, it is reused
+        rather than being decoded again.
         """
-        bl_image = bpy.data.images.load(str(image_path))
-        if pack_image_data:
+        bl_image = bpy.data.images.load(str(image_path), check_existing=True)
+        if pack_image_data and not bl_image.packed_file:
             bl_image.pack()  # embed Image data into Blend file
         return cls(bl_image)
 
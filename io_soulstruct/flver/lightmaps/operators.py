@@ -13,7 +13,6 @@ import bpy
 from soulstruct.base.models.mtd import MTDBND
 from soulstruct.darksouls1r.models.shaders import MatDef as DS1R_MatDef
 
-from io_soulstruct.exceptions import SoulstructTypeError
 from io_soulstruct.flver.material.types import BlenderFLVERMaterial
 from io_soulstruct.flver.models.types import BlenderFLVER
 from io_soulstruct.utilities.operators import LoggingOperator
@@ -83,12 +82,16 @@ class BakeLightmapTextures(LoggingOperator):
 
     @classmethod
     def poll(cls, context):
-        """FLVER meshes must be selected."""
-        try:
-            bl_flvers = BlenderFLVER.from_selected_objects(context)
-        except SoulstructTypeError:
-            return False
-        return True
+        """FLVER meshes must be selected (and nothing else).
+
+        Same checks as `BlenderFLVER.from_selected_objects()` and the `BlenderFLVER` constructor, without creating any
+        wrappers on every redraw.
+        """
+        selected_objects = context.selected_objects
+        return bool(selected_objects) and all(
+            obj.soulstruct_type == BlenderFLVER.TYPE and obj.type == BlenderFLVER.OBJ_DATA_TYPE
+            for obj in selected_objects
+        )
 
     def execute(self, context):
         """
@@ -110,13 +113,15 @@ class BakeLightmapTextures(LoggingOperator):
         bl_flvers = BlenderFLVER.from_selected_objects(context)  # type: list[BlenderFLVER]
 
         # Set up variables/function to restore original state after bake.
-        original_lightmap_strengths = []  # pairs of `(node, value)`
+        # Parallel lists of overlay nodes and their original 'Fac' values.
+        original_lightmap_nodes = []  # type: list[bpy.types.Node]
+        original_lightmap_strengths = []  # type: list[float]
         render_settings = {}
 
         def restore_originals():
             # NOTE: Does NOT restore old active UV layer, as you most likely want to immediately see the bake result
             # in the Image Viewer.
-            for _node, _strength in original_lightmap_strengths:
+            for _node, _strength in zip(original_lightmap_nodes, original_lightmap_strengths):
                 _node.inputs["Fac"].default_value = _strength
             # Restore render settings.
             if "engine" in render_settings:
@@ -129,6 +134,12 @@ class BakeLightmapTextures(LoggingOperator):
 
         self.cleanup_callback = restore_originals
 
+        # Materials may be shared by multiple selected FLVERs. Their lightmap nodes are only looked up (and their
+        # overlay strengths only modified) once.
+        lightmap_nodes_by_material = {}  # type: dict[str, bpy.types.ShaderNodeTexImage]
+        # Many materials share the same MTD, so MatDefs are only created once per MTD name.
+        matdefs_by_mtd_name = {}  # type: dict[str, DS1R_MatDef]
+
         target_image = None  # type: bpy.types.Image | None
         for bl_flver in bl_flvers:
 
@@ -138,7 +149,10 @@ class BakeLightmapTextures(LoggingOperator):
                     material_slot,
                     mtdbnd,
                     bake_settings,
+                    original_lightmap_nodes,
                     original_lightmap_strengths,
+                    lightmap_nodes_by_material,
+                    matdefs_by_mtd_name,
                     assert_lightmap_image=target_image,
                 )
                 if material_target_image:
@@ -172,7 +186,10 @@ class BakeLightmapTextures(LoggingOperator):
         material_slot: bpy.types.MaterialSlot,
         mtdbnd: MTDBND,
         bake_settings: BakeLightmapSettings,
-        original_lightmap_strengths: list[tuple[bpy.types.Node, float]],
+        original_lightmap_nodes: list[bpy.types.Node],
+        original_lightmap_strengths: list[float],
+        lightmap_nodes_by_material: dict[str, bpy.types.ShaderNodeTexImage],
+        matdefs_by_mtd_name: dict[str, DS1R_MatDef],
         assert_lightmap_image: bpy.types.Image = None,
     ) -> bpy.types.Image:
         """Ensures that the appropriate lightmap texture node is selected and that the appropriate UV layer is active.
@@ -187,28 +204,40 @@ class BakeLightmapTextures(LoggingOperator):
         Returns the name of the Blender image assigned to the lightmap texture node. The caller will ensure that all
         selected meshes/materials are using the same lightmap texture. If no lightmap texture node is found, an error
         will be raised, to ensure that the user is fully aware of what meshes they are trying to bake.
+
+        Lightmap nodes of materials already parsed for another mesh are taken from `lightmap_nodes_by_material`, and
+        their overlay strengths are not modified (or recorded as 'original') again.
         """
         mesh = bl_flver.mesh
         bl_material = BlenderFLVERMaterial(material_slot.material)
         if not bl_material.mat_def_path:
             raise ValueError(f"Material '{bl_material.name}' of mesh {mesh.name} has no MTD path set.")
         mtd_name = Path(bl_material.mat_def_path).name
-        matdef = DS1R_MatDef.from_mtdbnd_or_name(mtd_name, mtdbnd)
+        try:
+            matdef = matdefs_by_mtd_name[mtd_name]
+        except KeyError:
+            matdef = matdefs_by_mtd_name[mtd_name] = DS1R_MatDef.from_mtdbnd_or_name(mtd_name, mtdbnd)
 
         texture_node_name = bake_settings.texture_node_name
+        nodes = bl_material.node_tree.nodes
 
-        try:
-            # noinspection PyTypeChecker
-            lightmap_node = bl_material.node_tree.nodes[texture_node_name]
-        except KeyError:
-            raise ValueError(
-                f"Material '{bl_material.name}' of mesh {mesh.name} has no texture node named '{texture_node_name}'."
-            )
-        if lightmap_node.type != "TEX_IMAGE":
-            raise ValueError(
-                f"Material '{bl_material.name}' of mesh {mesh.name} has a node named '{texture_node_name}', but it is "
-                f"not an Image Texture node."
-            )
+        lightmap_node = lightmap_nodes_by_material.get(bl_material.name)
+        is_new_material = lightmap_node is None
+        if is_new_material:
+            try:
+                # noinspection PyTypeChecker
+                lightmap_node = nodes[texture_node_name]
+            except KeyError:
+                raise ValueError(
+                    f"Material '{bl_material.name}' of mesh {mesh.name} has no texture node named "
+                    f"'{texture_node_name}'."
+                )
+            if lightmap_node.type != "TEX_IMAGE":
+                raise ValueError(
+                    f"Material '{bl_material.name}' of mesh {mesh.name} has a node named '{texture_node_name}', but it "
+                    f"is not an Image Texture node."
+                )
+            lightmap_nodes_by_material[bl_material.name] = lightmap_node
         lightmap_node: bpy.types.ShaderNodeTexImage
 
         lightmap_image = lightmap_node.image
@@ -217,14 +246,14 @@ class BakeLightmapTextures(LoggingOperator):
                 f"Material '{bl_material.name}' of mesh {mesh.name} has no image assigned to its "
                 f"'{texture_node_name}' texture node."
             )
-        if lightmap_image.name != assert_lightmap_image.name:
+        if assert_lightmap_image is not None and lightmap_image.name != assert_lightmap_image.name:
             raise ValueError(
                 f"Material '{bl_material.name}' of mesh {mesh.name} has image '{lightmap_image.name}' assigned to its "
                 f"'{texture_node_name}' texture node, but '{assert_lightmap_image.name}' was expected."
             )
 
         # Activate and select lightmap texture for bake target of this mesh/material.
-        bl_material.node_tree.nodes.active = lightmap_node
+        nodes.active = lightmap_node
         lightmap_node.select = True
 
         # Activate UV layer used by lightmap.
@@ -247,12 +276,15 @@ class BakeLightmapTextures(LoggingOperator):
                 f"in material '{bl_material.name}' of mesh {mesh.name}. Will not modify this shader for new bake!"
             )
         else:
-            original_lightmap_strengths.append((overlay_node, overlay_node_fac.default_value))
-            # Detect which mix slot lightmap is using and set factor to disable lightmap while baking.
-            if overlay_node.inputs[1].links[0].from_node == lightmap_node:  # input 1
-                overlay_node_fac.default_value = 1.0
-            else:  # input 2 (expected)
-                overlay_node_fac.default_value = 0.0
+            # Skipped if material was already modified for another mesh, so its recorded original value is kept.
+            if is_new_material:
+                original_lightmap_nodes.append(overlay_node)
+                original_lightmap_strengths.append(overlay_node_fac.default_value)
+                # Detect which mix slot lightmap is using and set factor to disable lightmap while baking.
+                if overlay_node.inputs[1].links[0].from_node == lightmap_node:  # input 1
+                    overlay_node_fac.default_value = 1.0
+                else:  # input 2 (expected)
+                    overlay_node_fac.default_value = 0.0
 
         if bake_settings.bake_rendered_only and mesh.hide_render:
             self.info(
@@ -626,8 +626,9 @@ class SelectMeshChildren(LoggingOperator):
         return context.active_object and context.active_object.type in {"ARMATURE", "MESH"}
 
     def execute(self, context):
+        children_index = build_children_index()
         for obj in context.selected_objects:
-            for child in obj.children:
+            for child in children_index.get(obj.name, ()):
                 if child.type == "MESH":
                     child.select_set(True)
             if obj.type != "MESH":
@@ -646,10 +647,12 @@ def draw_dummy_ids():
     if not settings.dummy_id_draw_enabled:
         return
 
-    if not bpy.context.selected_objects:
+    # Called on every viewport redraw, so selection is only fetched once.
+    selected_objects = bpy.context.selected_objects
+    if not selected_objects:
         return
 
-    obj = bpy.context.selected_objects[0]
+    obj = selected_objects[0]
     try:
         bl_flver = BlenderFLVER.from_armature_or_mesh(obj)
     except SoulstructTypeError:
@@ -33,6 +33,10 @@ if tp.TYPE_CHECKING:
     from io_soulstruct.type_checking import CHRBND_TYPING, OBJBND_TYPING, PARTSBND_TYPING
 
 
+# Number of converted Map Piece FLVERs held in memory before they are written (concurrently) by `ExportMapPieceFLVERs`.
+_MAP_PIECE_WRITE_BATCH_SIZE = 16
+
+
 # region Generic Exporters
 
 class ExportLooseFLVER(LoggingOperator, ExportHelper):
@@ -280,10 +284,23 @@ class ExportMapPieceFLVERs(LoggingOperator):
         active_object = context.active_object  # to restore later
 
         map_area_textures = {}  # maps area stems 'mAA' to dictionaries of Blender images to export
+        collection_map_stems = (
+            get_collection_map_stems(bl_flver.mesh for bl_flver in bl_flvers)
+            if settings.detect_map_from_collection else {}
+        )
+        oldest_map_stems = {}  # type: dict[str, str]  # detected map stem -> oldest version
+        # FLVERs are converted one by one (using Blender data) but then written concurrently in bounded batches, so
+        # that only a limited number of converted FLVERs are held in memory at once.
+        flvers_and_relative_paths = []  # type: list[tuple[FLVER, Path]]
 
         for bl_flver in bl_flvers:
 
-            map_stem = settings.get_map_stem_for_export(bl_flver.mesh, oldest=True)
+            map_stem = settings.get_map_stem_for_export(
+                bl_flver.mesh,
+                oldest=True,
+                collection_map_stems=collection_map_stems,
+                versioned_map_stems=oldest_map_stems,
+            )
             relative_map_path = Path(f"map/{map_stem}")
             texture_collection = DDSTextureCollection()
 
@@ -295,13 +312,17 @@ class ExportMapPieceFLVERs(LoggingOperator):
                     texture_collection,
                 )
             except Exception as ex:
-                traceback.print_exc()
+                self.print_debug_traceback()
+                settings.export_files(self, flvers_and_relative_paths)  # still write FLVERs converted before this one
                 return self.error(
                     f"Cannot export Map Piece FLVER '{bl_flver.export_name}' from '{bl_flver.name}. Error: {ex}"
                 )
 
             flver.dcx_type = flver_dcx_type
-            settings.export_file(self, flver, relative_map_path / f"{bl_flver.export_name}.flver")
+            flvers_and_relative_paths.append((flver, relative_map_path / f"{bl_flver.export_name}.flver"))
+            if len(flvers_and_relative_paths) >= _MAP_PIECE_WRITE_BATCH_SIZE:
+                settings.export_files(self, flvers_and_relative_paths)
+                flvers_and_relative_paths.clear()
 
             if flver_export_settings.export_textures:
                 # Collect all Blender images for batched map area export.
@@ -309,6 +330,8 @@ class ExportMapPieceFLVERs(LoggingOperator):
                 area_textures = map_area_textures.setdefault(area, DDSTextureCollection())
                 area_textures |= texture_collection
 
+        settings.export_files(self, flvers_and_relative_paths)
+
         if map_area_textures:  # only non-empty if texture export enabled
             for map_area, texture_collection in map_area_textures.items():
                 export_map_area_textures(self, context, map_area, texture_collection)
@@ -739,11 +739,13 @@ class BlenderFLVER(SoulstructObject[FLVER, FLVERProps]):
             # This is done even when `existing_armature` is given, as the order of bones in this new FLVER may be
             # different and the vertex weight indices need to be directed to the names of bones in `existing_armature`
             # correctly.
+            bl_bone_name_set = set()
             for bone in flver.bones:
                 # Just using actual bone names to avoid the need for parsing rules on export. However, duplicate names
                 # need to be handled with suffixes.
-                bl_bone_name = f"{bone.name} <DUPE>" if bone.name in bl_bone_names else bone.name
+                bl_bone_name = f"{bone.name} <DUPE>" if bone.name in bl_bone_name_set else bone.name
                 bl_bone_names.append(bl_bone_name)
+                bl_bone_name_set.add(bl_bone_name)
 
             # Create Blender Armature. We have to do this first so mesh vertices can be weighted to its bones.
             operator.to_object_mode()
@@ -1733,8 +1735,8 @@ class BlenderFLVER(SoulstructObject[FLVER, FLVERProps]):
 
         # 2. Validate UV layers: ensure all required material UV layer names are present, and warn if any unexpected
         #    Blender UV layers are present.
-        bl_uv_layer_names = self.mesh.data.uv_layers.keys()
-        remaining_bl_uv_layer_names = set(bl_uv_layer_names)
+        bl_uv_layer_names = set(self.mesh.data.uv_layers.keys())
+        remaining_bl_uv_layer_names = bl_uv_layer_names.copy()
         used_uv_layer_names = set()
         for matdef, bl_material in zip(matdefs, self.mesh.data.materials):
             for used_layer in matdef.get_used_uv_layers():
@@ -2246,21 +2248,29 @@ class BlenderFLVER(SoulstructObject[FLVER, FLVERProps]):
     @classmethod
     def get_selected_flver(cls, context: bpy.types.Context) -> BlenderFLVER:
         """Get the Mesh and (optional) Armature components of a single selected FLVER object of either type."""
-        if not context.selected_objects:
+        selected_objects = context.selected_objects
+        if not selected_objects:
             raise FLVERError("No FLVER Mesh or Armature selected.")
-        elif len(context.selected_objects) > 1:
+        elif len(selected_objects) > 1:
             raise FLVERError("Multiple objects selected. Exactly one FLVER Mesh or Armature must be selected.")
-        _, mesh = cls.parse_flver_obj(context.selected_objects[0])
+        _, mesh = cls.parse_flver_obj(selected_objects[0])
         return cls(mesh)
 
     @classmethod
     def get_selected_flvers(cls, context: bpy.types.Context) -> list[BlenderFLVER]:
         """Get the Mesh and (optional) Armature components of ALL selected FLVER objects of either type."""
-        if not context.selected_objects:
+        selected_objects = context.selected_objects
+        if not selected_objects:
             raise SoulstructTypeError("No FLVER Meshes or Armatures selected.")
+
+        # Every `Object.children` access scans all Blender objects, so we index children once for all Armatures.
+        children_index = None
+        if any(obj.type == "ARMATURE" for obj in selected_objects):
+            children_index = build_children_index()
+
         flvers = []
-        for obj in context.selected_objects:
-            _, mesh = cls.parse_flver_obj(obj)
+        for obj in selected_objects:
+            _, mesh = cls.parse_flver_obj(obj, children_index)
             flvers.append(cls(mesh))
         return flvers
 
@@ -2273,14 +2283,22 @@ class BlenderFLVER(SoulstructObject[FLVER, FLVERProps]):
         return True
 
     @staticmethod
-    def parse_flver_obj(obj: bpy.types.Object) -> tuple[bpy.types.ArmatureObject | None, bpy.types.MeshObject]:
-        """Parse a Blender object into a Mesh and (optional) Armature object."""
+    def parse_flver_obj(
+        obj: bpy.types.Object,
+        children_index: dict[str, list[bpy.types.Object]] | None = None,
+    ) -> tuple[bpy.types.ArmatureObject | None, bpy.types.MeshObject]:
+        """Parse a Blender object into a Mesh and (optional) Armature object.
+
+        `children_index` (from `build_children_index()`) can be given to look up Armature children by parent name when
+        parsing many objects, rather than scanning all Blender objects for each Armature.
+        """
         if obj.type == "MESH" and obj.soulstruct_type == SoulstructType.FLVER:
             mesh = obj
             armature = mesh.parent if mesh.parent is not None and mesh.parent.type == "ARMATURE" else None
         elif obj.type == "ARMATURE":
             armature = obj
-            mesh_children = [child for child in armature.children if child.type == "MESH"]
+            children = children_index.get(armature.name, ()) if children_index is not None else armature.children
+            mesh_children = [child for child in children if child.type == "MESH"]
             if not mesh_children or mesh_children[0].soulstruct_type != SoulstructType.FLVER:
                 raise SoulstructTypeError(
                     f"Armature '{armature.name}' has no FLVER Mesh child. Please create it, even if empty, and set its "
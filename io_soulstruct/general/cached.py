@@ -8,6 +8,7 @@ __all__ = [
     "clear_cached_matdefs",
 ]
 
+import hashlib
 import typing as tp
 from pathlib import Path
 
@@ -26,6 +27,9 @@ if tp.TYPE_CHECKING:
 # Maps file paths to `(BaseBinaryFile, blake2b_hash)` tuples for caching. Useful for inspecting, say, MSB files
 # repeatedly without modifying them.
 _CACHED_FILES = {}
+# Maps file paths cached by `get_cached_file()` to the `(st_mtime_ns, st_size)` of the file when it was hashed. If these
+# are unchanged, the cached file is returned without reading and hashing the file again.
+_CACHED_FILE_STATS = {}  # type: dict[Path, tuple[int, int]]
 
 
 def get_cached_file(file_path: Path | str, file_type: type[BASE_BINARY_FILE_T]) -> BASE_BINARY_FILE_T:
@@ -38,14 +42,24 @@ def get_cached_file(file_path: Path | str, file_type: type[BASE_BINARY_FILE_T])
     if not file_path.is_file():
         # Not loaded, even if cached.
         _CACHED_FILES.pop(file_path, None)
+        _CACHED_FILE_STATS.pop(file_path, None)
         raise FileNotFoundError(f"Cannot find file '{file_path}'.")
 
+    stat = file_path.stat()
+    file_stats = (stat.st_mtime_ns, stat.st_size)
+    if file_path in _CACHED_FILES and _CACHED_FILE_STATS.get(file_path) == file_stats:
+        game_file = _CACHED_FILES[file_path][0]
+        if isinstance(game_file, file_type):
+            # File untouched since it was last hashed. Can return cached file without reading it.
+            return game_file
+
     # The hashing process reads the file anyway, so we may as well save the second read if it's actually needed.
     file_data = file_path.read_bytes()
     file_path_hash = get_blake2b_hash(file_data)
+    _CACHED_FILE_STATS[file_path] = file_stats
     if file_path in _CACHED_FILES:
         game_file, cached_hash = _CACHED_FILES[file_path]
-        if cached_hash == file_path_hash:
+        if cached_hash == file_path_hash and isinstance(game_file, file_type):
             # Can return cached file.
             return game_file
         # Hash has changed, so update cache below.
@@ -76,10 +90,13 @@ def get_cached_bxf(bhd_path: Path | str) -> Binder:
         raise FileNotFoundError(f"Cannot find file '{bhd_path}' and/or file '{bdt_path}'.")
 
     # The hashing process reads the file anyway, so we may as well save the second read if it's actually needed.
-    # Here, we hash both BHD and BDT files together, since they are always paired.
+    # Here, we hash both BHD and BDT files together, since they are always paired. (Hashed incrementally, rather than
+    # concatenating them, to avoid an extra copy of the potentially huge BDT data.)
     bhd_data = bhd_path.read_bytes()
     bdt_data = bdt_path.read_bytes()
-    bhd_bdt_hash = get_blake2b_hash(bhd_data + bdt_data)
+    hasher = hashlib.blake2b(bhd_data)
+    hasher.update(bdt_data)
+    bhd_bdt_hash = hasher.digest()
     if bhd_path in _CACHED_FILES:
         bxf, cached_hash = _CACHED_FILES[bhd_path]
         if cached_hash == bhd_bdt_hash:
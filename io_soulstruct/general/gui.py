@@ -14,9 +14,20 @@ __all__ = [
 
 import bpy
 
-from .operators import *
+from .operators import LoadCollectionsFromBlend, SelectGameMapDirectory, SelectProjectMapDirectory
 from .properties import SoulstructSettings
 
+# Operator IDs are fixed at class definition, so they are resolved once here rather than on every panel redraw.
+_SELECT_GAME_MAP_DIRECTORY = SelectGameMapDirectory.bl_idname
+_SELECT_PROJECT_MAP_DIRECTORY = SelectProjectMapDirectory.bl_idname
+_LOAD_COLLECTIONS_FROM_BLEND = LoadCollectionsFromBlend.bl_idname
+
+# Maps `Game.variable_name` to the (label, property) of its custom material BND path. Games not listed use MTDBND.
+_MATERIAL_BND_PATH_PROPS = {
+    "ELDEN_RING": ("Custom MATBINBND Path:", "str_matbinbnd_path"),
+}
+_DEFAULT_MATERIAL_BND_PATH_PROP = ("Custom MTDBND Path:", "str_mtdbnd_path")
+
 
 class _GlobalSettingsPanel_ViewMixin:
     """VIEW properties panel mix-in for Soulstruct global settings."""
@@ -30,48 +41,43 @@ class _GlobalSettingsPanel_ViewMixin:
 
         game = settings.game
         if game:
-            layout.label(text="Game Root:")
-            layout.prop(settings, settings.get_game_root_prop_name(), text="")
-            layout.label(text="Project Root:")
-            layout.prop(settings, settings.get_project_root_prop_name(), text="")
+            _labeled_prop(layout, settings, settings.get_game_root_prop_name(game), "Game Root:")
+            _labeled_prop(layout, settings, settings.get_project_root_prop_name(game), "Project Root:")
         else:
             layout.label(text="Unsupported Game")
 
         header, panel = layout.panel("Import/Export Settings", default_closed=True)
         header.label(text="Import/Export Settings")
         if panel:
-            panel.prop(settings, "import_bak_file")
-            panel.prop(settings, "prefer_import_from_project")
-            panel.prop(settings, "also_export_to_game")
-            panel.prop(settings, "smart_map_version_handling")
-            panel.label(text="Soulstruct GUI Project Path:")
-            panel.prop(settings, "soulstruct_project_root_str", text="")
+            flags_column = panel.column(align=True)
+            flags_column.prop(settings, "import_bak_file")
+            flags_column.prop(settings, "prefer_import_from_project")
+            flags_column.prop(settings, "also_export_to_game")
+            flags_column.prop(settings, "smart_map_version_handling")
+            _labeled_prop(panel, settings, "soulstruct_project_root_str", "Soulstruct GUI Project Path:")
 
         map_stem_box(layout, settings)
 
         header, panel = layout.panel("Material/Texture Settings", default_closed=True)
         header.label(text="Material/Texture Settings")
         if panel:
-            if settings.is_game("ELDEN_RING"):
-                panel.label(text="Custom MATBINBND Path:")
-                panel.prop(settings, "str_matbinbnd_path", text="")
-            else:
-                panel.label(text="Custom MTDBND Path:")
-                panel.prop(settings, "str_mtdbnd_path", text="")
-
-            panel.label(text="Image Cache Directory:")
-            panel.prop(settings, "str_image_cache_directory", text="")
+            label, prop = _MATERIAL_BND_PATH_PROPS.get(settings.game_enum, _DEFAULT_MATERIAL_BND_PATH_PROP)
+            _labeled_prop(panel, settings, prop, label)
+
+            _labeled_prop(panel, settings, "str_image_cache_directory", "Image Cache Directory:")
             panel.prop(settings, "image_cache_format")
-            panel.prop(settings, "read_cached_images")
-            panel.prop(settings, "write_cached_images")
-            panel.prop(settings, "pack_image_data")
+            cache_column = panel.column(align=True)
+            cache_column.prop(settings, "read_cached_images")
+            cache_column.prop(settings, "write_cached_images")
+            cache_column.prop(settings, "pack_image_data")
 
-        layout.operator(LoadCollectionsFromBlend.bl_idname, text="Load BLEND Collections")
+        layout.operator(_LOAD_COLLECTIONS_FROM_BLEND, text="Load BLEND Collections")
 
         # Convenience: expose Soulstruct Type of active object, for manual editing.
-        if context.active_object:
-            layout.label(text=f"Name: {context.active_object.name}")
-            layout.prop(context.active_object, "soulstruct_type", text="Active Object Type")
+        active_object = context.active_object
+        if active_object:
+            layout.label(text=f"Name: {active_object.name}")
+            layout.prop(active_object, "soulstruct_type", text="Active Object Type")
 
 
 class GlobalSettingsPanel(bpy.types.Panel, _GlobalSettingsPanel_ViewMixin):
@@ -83,74 +89,36 @@ class GlobalSettingsPanel(bpy.types.Panel, _GlobalSettingsPanel_ViewMixin):
     bl_context = "scene"
 
 
-class GlobalSettingsPanel_FLVERView(bpy.types.Panel, _GlobalSettingsPanel_ViewMixin):
-    """VIEW properties panel for Soulstruct global settings."""
-    bl_label = "General Settings"
-    bl_idname = "VIEW_PT_soulstruct_settings_flver"
-    bl_space_type = "VIEW_3D"
-    bl_region_type = "UI"
-    bl_category = "FLVER"
-    bl_options = {"DEFAULT_CLOSED"}
-
-
-class GlobalSettingsPanel_MSBView(bpy.types.Panel, _GlobalSettingsPanel_ViewMixin):
-    """VIEW properties panel for Soulstruct global settings."""
-    bl_label = "General Settings"
-    bl_idname = "VIEW_PT_soulstruct_settings_msb"
-    bl_space_type = "VIEW_3D"
-    bl_region_type = "UI"
-    bl_category = "MSB"
-    bl_options = {"DEFAULT_CLOSED"}
-
-
-class GlobalSettingsPanel_NavmeshView(bpy.types.Panel, _GlobalSettingsPanel_ViewMixin):
-    """VIEW properties panel for Soulstruct global settings."""
-    bl_label = "General Settings"
-    bl_idname = "VIEW_PT_soulstruct_settings_navmesh"
-    bl_space_type = "VIEW_3D"
-    bl_region_type = "UI"
-    bl_category = "Navmesh"
-    bl_options = {"DEFAULT_CLOSED"}
-
-
-class GlobalSettingsPanel_NavGraphView(bpy.types.Panel, _GlobalSettingsPanel_ViewMixin):
-    """VIEW properties panel for Soulstruct global settings."""
-    bl_label = "General Settings"
-    bl_idname = "VIEW_PT_soulstruct_settings_navgraph"
-    bl_space_type = "VIEW_3D"
-    bl_region_type = "UI"
-    bl_category = "NavGraph (MCG)"
-    bl_options = {"DEFAULT_CLOSED"}
-
-
-class GlobalSettingsPanel_AnimationView(bpy.types.Panel, _GlobalSettingsPanel_ViewMixin):
-    """VIEW properties panel for Soulstruct Animation global settings."""
-    bl_label = "General Settings"
-    bl_idname = "VIEW_PT_soulstruct_settings_animation"
-    bl_space_type = "VIEW_3D"
-    bl_region_type = "UI"
-    bl_category = "Animation"
-    bl_options = {"DEFAULT_CLOSED"}
-
-
-class GlobalSettingsPanel_CollisionView(bpy.types.Panel, _GlobalSettingsPanel_ViewMixin):
-    """VIEW properties panel for Soulstruct Collision global settings."""
-    bl_label = "General Settings"
-    bl_idname = "VIEW_PT_soulstruct_settings_collision"
-    bl_space_type = "VIEW_3D"
-    bl_region_type = "UI"
-    bl_category = "Collision"
-    bl_options = {"DEFAULT_CLOSED"}
-
-
-class GlobalSettingsPanel_CutsceneView(bpy.types.Panel, _GlobalSettingsPanel_ViewMixin):
-    """VIEW properties panel for Soulstruct global settings."""
-    bl_label = "General Settings"
-    bl_idname = "VIEW_PT_soulstruct_settings_cutscene"
-    bl_space_type = "VIEW_3D"
-    bl_region_type = "UI"
-    bl_category = "Cutscene"
-    bl_options = {"DEFAULT_CLOSED"}
+def _make_view_panel(name_suffix: str, category: str) -> type[bpy.types.Panel]:
+    """Create a collapsed VIEW_3D sidebar copy of the global settings panel under the given `category` tab."""
+    return type(
+        f"GlobalSettingsPanel_{name_suffix}View",
+        (bpy.types.Panel, _GlobalSettingsPanel_ViewMixin),
+        {
+            "__doc__": f"VIEW properties panel for Soulstruct global settings in {category} tab.",
+            "bl_label": "General Settings",
+            "bl_idname": f"VIEW_PT_soulstruct_settings_{name_suffix.lower()}",
+            "bl_space_type": "VIEW_3D",
+            "bl_region_type": "UI",
+            "bl_category": category,
+            "bl_options": {"DEFAULT_CLOSED"},
+        },
+    )
+
+
+GlobalSettingsPanel_FLVERView = _make_view_panel("FLVER", "FLVER")
+GlobalSettingsPanel_MSBView = _make_view_panel("MSB", "MSB")
+GlobalSettingsPanel_NavmeshView = _make_view_panel("Navmesh", "Navmesh")
+GlobalSettingsPanel_NavGraphView = _make_view_panel("NavGraph", "NavGraph (MCG)")
+GlobalSettingsPanel_AnimationView = _make_view_panel("Animation", "Animation")
+GlobalSettingsPanel_CollisionView = _make_view_panel("Collision", "Collision")
+GlobalSettingsPanel_CutsceneView = _make_view_panel("Cutscene", "Cutscene")
+
+
+def _labeled_prop(layout: bpy.types.UILayout, settings: SoulstructSettings, prop: str, label: str):
+    """Draw `label` on its own line above an unlabeled `prop` field (used for long path strings)."""
+    layout.label(text=label)
+    layout.prop(settings, prop, text="")
 
 
 def map_stem_box(layout: bpy.types.UILayout, settings: SoulstructSettings):
@@ -159,5 +127,5 @@ def map_stem_box(layout: bpy.types.UILayout, settings: SoulstructSettings):
     map_box.prop(settings, "map_stem", text="")
     row = map_box.row()
     split = row.split(factor=0.5)
-    split.column().operator(SelectGameMapDirectory.bl_idname, text="Select Game Map")
-    split.column().operator(SelectProjectMapDirectory.bl_idname, text="Select Project Map")
+    split.column().operator(_SELECT_GAME_MAP_DIRECTORY, text="Select Game Map")
+    split.column().operator(_SELECT_PROJECT_MAP_DIRECTORY, text="Select Project Map")
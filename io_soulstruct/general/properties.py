@@ -5,9 +5,11 @@ __all__ = [
     "SoulstructSettings",
 ]
 
+import os
 import traceback
 import shutil
 import typing as tp
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import bpy
@@ -28,6 +30,12 @@ if tp.TYPE_CHECKING:
     from io_soulstruct.utilities import LoggingOperator
 
 _SETTINGS_PATH = Path(__file__).parent.parent / "SoulstructSettings.json"
+_FILE_COMPARE_CHUNK_SIZE = 1 << 20  # 1 MiB
+# Upper limit on writer threads used by `SoulstructSettings.export_files()`. Packing is mostly GIL-bound, so more
+# threads than this only add overhead.
+_EXPORT_FILES_MAX_WORKERS = 8
+# `MSB` classes already imported by `SoulstructSettings.get_game_msb_class()`, keyed by game.
+_GAME_MSB_CLASSES = {}  # type: dict[Game, type[MSB_TYPING]]
 
 
 # Global holder for games that front-end users can currently select (or have auto-detected) for the `game` enum.
@@ -365,13 +373,13 @@ class SoulstructSettings(bpy.types.PropertyGroup):
             max_submesh_vertex_count=4294967295,  # faces use 32-bit vertex indices
         )
 
-    def get_game_root_prop_name(self):
-        """Get the name of the game root property for the current game."""
-        return f"{self.game.submodule_name}_game_root_str"
+    def get_game_root_prop_name(self, game: Game | None = None):
+        """Get the name of the game root property for `game` (default: the current game)."""
+        return f"{(game or self.game).submodule_name}_game_root_str"
 
-    def get_project_root_prop_name(self):
-        """Get the name of the project root property for the current game."""
-        return f"{self.game.submodule_name}_project_root_str"
+    def get_project_root_prop_name(self, game: Game | None = None):
+        """Get the name of the project root property for `game` (default: the current game)."""
+        return f"{(game or self.game).submodule_name}_project_root_str"
 
     def auto_set_game(self):
         """Determine `game` enum value from `game_directory`."""
@@ -560,18 +568,26 @@ class SoulstructSettings(bpy.types.PropertyGroup):
         return False
 
     def export_file(
-        self, operator: LoggingOperator, file: BaseBinaryFile, relative_path: Path, class_name=""
+        self,
+        operator: LoggingOperator,
+        file: BaseBinaryFile,
+        relative_path: Path,
+        class_name="",
+        skip_unchanged=False,
     ) -> set[str]:
         """Write `file` to `relative_path` in project directory (if given) and optionally also to game directory if
         `also_export_to_game` is enabled.
 
         `class_name` is used for logging and will be automatically detected from `file` if not given.
+
+        If `skip_unchanged` is True, nothing is written (and no '.bak' is created) if every destination file already
+        exists with exactly the packed data of `file`. Note that this packs `file` an extra time when it has changed.
         """
         if relative_path.is_absolute():
             # Indicates a mistake in an operator.
             raise ValueError(f"Relative path for export must be relative to game root, not absolute: {relative_path}")
         try:
-            self._export_file(operator, file, relative_path, class_name)
+            self._export_file(operator, file, relative_path, class_name, skip_unchanged)
         except Exception as e:
             traceback.print_exc()
             operator.report({"ERROR"}, f"Failed to export {class_name if class_name else '<unknown>'} file: {e}")
@@ -579,30 +595,37 @@ class SoulstructSettings(bpy.types.PropertyGroup):
 
         return {"FINISHED"}
 
-    def _export_file(self, operator: LoggingOperator, file: BaseBinaryFile, relative_path: Path, class_name=""):
+    def _export_file(
+        self,
+        operator: LoggingOperator,
+        file: BaseBinaryFile,
+        relative_path: Path,
+        class_name="",
+        skip_unchanged=False,
+    ):
         if not class_name:
             class_name = file.cls_name
 
         project_root = self.project_root
         game_root = self.game_root
 
+        if skip_unchanged:
+            destination_paths = []
+            if project_root:
+                destination_paths.append(project_root.get_file_path(relative_path))
+            if game_root and self.also_export_to_game:
+                destination_paths.append(game_root.get_file_path(relative_path))
+            if destination_paths and self._is_file_unchanged(file, destination_paths):
+                operator.info(f"{class_name} is unchanged and was not re-exported: {relative_path}")
+                return
+
         if project_root:
             project_path = project_root.get_file_path(relative_path)
             project_path.parent.mkdir(parents=True, exist_ok=True)
             written = file.write(project_path)  # will create '.bak' if appropriate
             operator.info(f"Exported {class_name} to: {written}")
             if game_root and self.also_export_to_game:
-                # Copy all written files to game directory, rather than re-exporting.
-                for written_path in written:
-                    written_relative_path = written_path.relative_to(self.project_root_path)
-                    game_path = game_root.get_file_path(written_relative_path)
-                    if game_path.is_file():
-                        create_bak(game_path)  # we may be about to replace it
-                        operator.info(f"Created backup file in game directory: {game_path}")
-                    else:
-                        game_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(written_path, game_path)
-                    operator.info(f"Copied exported {class_name} file to game directory: {game_path}")
+                self._copy_written_files_to_game(operator, written, game_root, class_name)
         elif game_root and self.also_export_to_game:
             game_path = game_root.get_file_path(relative_path)
             game_path.parent.mkdir(parents=True, exist_ok=True)
@@ -614,6 +637,113 @@ class SoulstructSettings(bpy.types.PropertyGroup):
                 f"set or 'Also Export to Game' is disabled."
             )
 
+    @staticmethod
+    def _is_file_unchanged(file: BaseBinaryFile, paths: list[Path]) -> bool:
+        """Check if all `paths` already exist and contain exactly the packed data of `file`.
+
+        Existing files are streamed through one reused chunk buffer and compared against views of the packed data, so
+        no full copy of any existing file is made and comparison stops at the first differing chunk.
+        """
+        if not all(path.is_file() for path in paths):
+            return False
+        packed = memoryview(file.to_bytes())
+        if any(path.stat().st_size != len(packed) for path in paths):
+            return False
+        chunk = memoryview(bytearray(min(len(packed), _FILE_COMPARE_CHUNK_SIZE) or 1))
+        for path in paths:
+            with path.open("rb") as f:
+                offset = 0
+                while size := f.readinto(chunk):
+                    if chunk[:size] != packed[offset:offset + size]:
+                        return False
+                    offset += size
+        return True
+
+    def _copy_written_files_to_game(
+        self, operator: LoggingOperator, written: tp.Iterable[Path], game_root: GameStructure, class_name: str
+    ):
+        """Copy all files written to project directory to game directory, rather than re-exporting."""
+        for written_path in written:
+            written_relative_path = written_path.relative_to(self.project_root_path)
+            game_path = game_root.get_file_path(written_relative_path)
+            if game_path.is_file():
+                create_bak(game_path)  # we may be about to replace it
+                operator.info(f"Created backup file in game directory: {game_path}")
+            else:
+                game_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(written_path, game_path)
+            operator.info(f"Copied exported {class_name} file to game directory: {game_path}")
+
+    def export_files(
+        self, operator: LoggingOperator, files_and_relative_paths: tp.Sequence[tuple[BaseBinaryFile, Path]]
+    ) -> set[str]:
+        """Version of `export_file` for multiple files, which are packed (including any DCX compression) and written
+        concurrently in worker threads.
+
+        Only `file.write()` runs in those threads, of which there are at most `_EXPORT_FILES_MAX_WORKERS` (or the CPU
+        count, if lower). Settings access, logging, and copying to the game directory all stay on the main thread.
+        Returned set contains "FINISHED" if any file was exported and "CANCELLED" if any failed.
+        """
+        for _, relative_path in files_and_relative_paths:
+            if relative_path.is_absolute():
+                # Indicates a mistake in an operator.
+                raise ValueError(
+                    f"Relative path for export must be relative to game root, not absolute: {relative_path}"
+                )
+        if not files_and_relative_paths:
+            return set()
+
+        project_root = self.project_root
+        game_root = self.game_root
+        if project_root:
+            write_root = project_root
+        elif game_root and self.also_export_to_game:
+            write_root = game_root
+        else:
+            operator.warning(
+                "Cannot export files. Project directory is not set and game directory is either not set or "
+                "'Also Export to Game' is disabled."
+            )
+            return {"FINISHED"}  # consistent with `export_file`
+
+        # Files with the same destination would race each other, so only the last one given is written (as it would
+        # have been when writing them sequentially).
+        files_by_write_path = {}  # type: dict[Path, BaseBinaryFile]
+        for file, relative_path in files_and_relative_paths:
+            write_path = write_root.get_file_path(relative_path)
+            if write_path in files_by_write_path:
+                operator.warning(f"Multiple {file.cls_name} files exported to '{write_path}'. Writing last one only.")
+            else:
+                write_path.parent.mkdir(parents=True, exist_ok=True)
+            files_by_write_path[write_path] = file
+
+        max_workers = min(_EXPORT_FILES_MAX_WORKERS, os.cpu_count() or 1, len(files_by_write_path))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(file.write, write_path)  # will create '.bak' if appropriate
+                for write_path, file in files_by_write_path.items()
+            ]
+
+        return_strings = set()
+        for file, future in zip(files_by_write_path.values(), futures):
+            class_name = file.cls_name
+            try:
+                written = future.result()
+                if project_root:
+                    operator.info(f"Exported {class_name} to: {written}")
+                    if game_root and self.also_export_to_game:
+                        self._copy_written_files_to_game(operator, written, game_root, class_name)
+                else:
+                    operator.info(f"Exported {class_name} to game directory only: {written}")
+            except Exception as e:
+                operator.print_debug_traceback()
+                operator.report({"ERROR"}, f"Failed to export {class_name} file: {e}")
+                return_strings.add("CANCELLED")
+            else:
+                return_strings.add("FINISHED")
+
+        return return_strings
+
     def export_file_data(
         self, operator: LoggingOperator, data: bytes, relative_path: Path, class_name: str
     ) -> set[str]:
@@ -801,19 +931,38 @@ class SoulstructSettings(bpy.types.PropertyGroup):
 
     # endregion
 
-    def get_map_stem_for_export(self, obj: bpy.types.Object = None, oldest=False, latest=False) -> str:
-        """Get map stem for export based on `obj` name, or fall back to settings map stem."""
+    def get_map_stem_for_export(
+        self,
+        obj: bpy.types.Object = None,
+        oldest=False,
+        latest=False,
+        collection_map_stems: dict[str, str] = None,
+        versioned_map_stems: dict[str, str] = None,
+    ) -> str:
+        """Get map stem for export based on `obj` name, or fall back to settings map stem.
+
+        Operators exporting many objects can pass `collection_map_stems` from `get_collection_map_stems()` to avoid
+        resolving each object's collections individually, and an initially empty `versioned_map_stems` dictionary
+        (reused for every object) to resolve the `oldest`/`latest` version of each unique map stem only once.
+        """
         if oldest and latest:
             raise ValueError("Cannot specify both `oldest` and `latest` as True when getting map stem for export.")
         if obj and self.detect_map_from_collection:
-            map_stem = get_collection_map_stem(obj)
+            map_stem = collection_map_stems.get(obj.name) if collection_map_stems else None
+            if not map_stem:
+                map_stem = get_collection_map_stem(obj)
         else:
             map_stem = self.map_stem
-        if oldest:
-            map_stem = self.get_oldest_map_stem_version(map_stem)
-        elif latest:
-            map_stem = self.get_latest_map_stem_version(map_stem)
-        return map_stem
+        if not oldest and not latest:
+            return map_stem
+        if versioned_map_stems is not None and map_stem in versioned_map_stems:
+            return versioned_map_stems[map_stem]
+        versioned_map_stem = (
+            self.get_oldest_map_stem_version(map_stem) if oldest else self.get_latest_map_stem_version(map_stem)
+        )
+        if versioned_map_stems is not None:
+            versioned_map_stems[map_stem] = versioned_map_stem
+        return versioned_map_stem
 
     # region Game Type Getters
 
@@ -832,12 +981,18 @@ class SoulstructSettings(bpy.types.PropertyGroup):
         return self.game.get_dcx_type(class_name)
 
     def get_game_msb_class(self) -> type[MSB_TYPING]:
-        """Get the `MSB` class associated with the selected game."""
+        """Get the `MSB` class associated with the selected game. Only imported once per game."""
+        game = self.game
+        try:
+            return _GAME_MSB_CLASSES[game]
+        except KeyError:
+            pass
         try:
-            return self.game.from_game_submodule_import("maps.msb", "MSB")
+            msb_class = _GAME_MSB_CLASSES[game] = game.from_game_submodule_import("maps.msb", "MSB")
         except ImportError:
             # TODO: Specific exception type?
-            raise UnsupportedGameError(f"Game {self.game} does not have an MSB class in Soulstruct.")
+            raise UnsupportedGameError(f"Game {game} does not have an MSB class in Soulstruct.")
+        return msb_class
 
     def get_game_matdef_class(self) -> type[MatDef]:
         """Get the `MatDef` class associated with the selected game."""
@@ -78,11 +78,13 @@ class CopyMeshSelectionOperator(LoggingOperator):
 
     @classmethod
     def poll(cls, context):
+        if context.mode != "EDIT_MESH":
+            return False
+        selected_objects = context.selected_objects
         return (
-            context.mode == "EDIT_MESH"
-            and len(context.selected_objects) == 1
-            and context.selected_objects[0].type == "MESH"
-            and context.selected_objects[0] is not context.edit_object
+            len(selected_objects) == 1
+            and selected_objects[0].type == "MESH"
+            and selected_objects[0] is not context.edit_object
         )
 
     def execute(self, context):
@@ -99,11 +101,13 @@ class CutMeshSelectionOperator(LoggingOperator):
 
     @classmethod
     def poll(cls, context):
+        if context.mode != "EDIT_MESH":
+            return False
+        selected_objects = context.selected_objects
         return (
-            context.mode == "EDIT_MESH"
-            and len(context.selected_objects) == 1
-            and context.selected_objects[0].type == "MESH"
-            and context.selected_objects[0] is not context.edit_object
+            len(selected_objects) == 1
+            and selected_objects[0].type == "MESH"
+            and selected_objects[0] is not context.edit_object
         )
 
     def execute(self, context):
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 __all__ = [
     "BlenderMSBCollision",
+    "cached_map_collision_hkxbhds",
 ]
 
 import traceback
 import typing as tp
+from contextlib import contextmanager
+from pathlib import Path
 
 import bpy
 from io_soulstruct.exceptions import MissingPartModelError, MapCollisionImportError
@@ -24,6 +27,43 @@ if tp.TYPE_CHECKING:
     from soulstruct.darksouls1ptde.maps.msb import MSB
 
 
+# Maps `(hi_path, lo_path)` pairs to opened `BothResHKXBHD`s, so that importing many MSB Collision parts from the same
+# map only opens its HKXBHDs once. Only active inside `cached_map_collision_hkxbhds()`.
+_OPENED_BOTH_RES_HKXBHDS = None  # type: dict[tuple[Path, Path], BothResHKXBHD] | None
+
+
+@contextmanager
+def cached_map_collision_hkxbhds():
+    """Within this context, DSR MSB Collision model imports reuse the `BothResHKXBHD` already opened for each map,
+    rather than opening both HKXBHDs again for every part.
+
+    Use around operations that import many MSB Collision models (e.g. MSB import). Opened binders are released when the
+    context exits.
+    """
+    global _OPENED_BOTH_RES_HKXBHDS
+    if _OPENED_BOTH_RES_HKXBHDS is not None:
+        yield  # already active
+        return
+    _OPENED_BOTH_RES_HKXBHDS = {}
+    try:
+        yield
+    finally:
+        _OPENED_BOTH_RES_HKXBHDS = None
+
+
+def _get_both_res_hkxbhd(hi_res_hkxbhd_path: Path, lo_res_hkxbhd_path: Path) -> BothResHKXBHD:
+    """Open `BothResHKXBHD` from given paths, or reuse it if already opened inside `cached_map_collision_hkxbhds()`."""
+    if _OPENED_BOTH_RES_HKXBHDS is None:
+        return BothResHKXBHD.from_both_paths(hi_res_hkxbhd_path, lo_res_hkxbhd_path)
+    key = (hi_res_hkxbhd_path, lo_res_hkxbhd_path)
+    try:
+        return _OPENED_BOTH_RES_HKXBHDS[key]
+    except KeyError:
+        pass
+    both_res_hkxbhd = _OPENED_BOTH_RES_HKXBHDS[key] = BothResHKXBHD.from_both_paths(*key)
+    return both_res_hkxbhd
+
+
 class BlenderMSBCollision(BlenderMSBPart[MSBCollision, MSBCollisionProps]):
     """Not FLVER-based.
 
@@ -181,12 +221,13 @@ class BlenderMSBCollision(BlenderMSBPart[MSBCollision, MSBCollisionProps]):
 
         if settings.is_game("DARK_SOULS_PTDE"):
             # No HKX binders; hi and lo-res models are loose HKX files in map directory.
-            hi_res_hkx_name = f"h{model_name[1:]}.hkx"
+            model_suffix = model_name[1:]
+            hi_res_hkx_name = f"h{model_suffix}.hkx"
             try:
                 hi_res_hkx_path = settings.get_import_map_file_path(hi_res_hkx_name)
             except FileNotFoundError:
                 raise FileNotFoundError(f"Cannot find hi-res HKX '{hi_res_hkx_name}' for map {map_stem}.")
-            lo_res_hkx_name = f"l{model_name[1:]}.hkx"
+            lo_res_hkx_name = f"l{model_suffix}.hkx"
             try:
                 lo_res_hkx_path = settings.get_import_map_file_path(lo_res_hkx_name)
             except FileNotFoundError:
@@ -218,16 +259,17 @@ class BlenderMSBCollision(BlenderMSBPart[MSBCollision, MSBCollisionProps]):
 
         elif settings.is_game("DARK_SOULS_DSR"):
             # NOTE: Hi and lo-res binders could end up being found in different import folders (project vs. game).
+            map_suffix = map_stem[1:]
             try:
-                hi_res_hkxbhd_path = settings.get_import_map_file_path(f"h{map_stem[1:]}.hkxbhd")
+                hi_res_hkxbhd_path = settings.get_import_map_file_path(f"h{map_suffix}.hkxbhd")
             except FileNotFoundError:
                 raise FileNotFoundError(f"Cannot find hi-res HKXBHD for map {map_stem}.")
             try:
-                lo_res_hkxbhd_path = settings.get_import_map_file_path(f"l{map_stem[1:]}.hkxbhd")
+                lo_res_hkxbhd_path = settings.get_import_map_file_path(f"l{map_suffix}.hkxbhd")
             except FileNotFoundError:
                 raise FileNotFoundError(f"Cannot find lo-res HKXBHD for map {map_stem}.")
 
-            both_res_hkxbhd = BothResHKXBHD.from_both_paths(hi_res_hkxbhd_path, lo_res_hkxbhd_path)
+            both_res_hkxbhd = _get_both_res_hkxbhd(hi_res_hkxbhd_path, lo_res_hkxbhd_path)
             hi_collision, lo_collision = both_res_hkxbhd.get_both_hkx(model_name)
 
             # Import single HKX.
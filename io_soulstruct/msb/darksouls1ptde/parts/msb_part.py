@@ -2,10 +2,12 @@ from __future__ import annotations
 
 __all__ = [
     "BlenderMSBPart",
+    "cached_msb_models",
 ]
 
 import abc
 import typing as tp
+from contextlib import contextmanager
 
 import bpy
 from io_soulstruct.exceptions import *
@@ -25,6 +27,30 @@ if tp.TYPE_CHECKING:
 PART_T = tp.TypeVar("PART_T", bound=MSBPart)
 SUBTYPE_PROPS_T = tp.TypeVar("SUBTYPE_PROPS_T", bound=bpy.types.PropertyGroup)
 
+# MSB models already found or created by `set_msb_model()`. Most models are shared by many parts, and `msb.auto_model()`
+# searches the MSB model lists (and may create a new model) every time. Keys are `(id(msb), part type, Blender model
+# object name, map stem)`. Only active inside `cached_msb_models()`.
+_CACHED_MSB_MODELS = None  # type: dict[tuple[int, type, str, str], MSBModel] | None
+
+
+@contextmanager
+def cached_msb_models():
+    """Within this context, `BlenderMSBPart.set_msb_model()` reuses the MSB model it already found or created for an
+    earlier part with the same model, rather than calling `msb.auto_model()` again.
+
+    Use around the export of all Parts of an MSB. Cached models (and the MSB they belong to) are released when the
+    context exits.
+    """
+    global _CACHED_MSB_MODELS
+    if _CACHED_MSB_MODELS is not None:
+        yield  # already active
+        return
+    _CACHED_MSB_MODELS = {}
+    try:
+        yield
+    finally:
+        _CACHED_MSB_MODELS = None
+
 
 class BlenderMSBPart(SoulstructObject[MSBPart, MSBPartProps], tp.Generic[PART_T, SUBTYPE_PROPS_T]):
     """Mesh-only MSB Part instance of a FLVER model of the corresponding Part subtype (Map Piece, Character, etc.).
@@ -246,9 +272,21 @@ class BlenderMSBPart(SoulstructObject[MSBPart, MSBPartProps], tp.Generic[PART_T,
             operator.warning(f"MSB Part '{part.name}' has no model set in Blender.")
             return None  # leave part field as `None`
 
+        model_key = None
+        if _CACHED_MSB_MODELS is not None:
+            # `msb` is alive for the whole context, so its `id()` cannot be reused by another MSB.
+            model_key = (id(msb), type(part), self.model.name, map_stem)
+            try:
+                part.model = _CACHED_MSB_MODELS[model_key]
+                return None
+            except KeyError:
+                pass
+
         # We use the `MSBModel` subclass to determine what name to look for.
         msb_model_name = self.SOULSTRUCT_MODEL_CLASS.model_file_stem_to_model_name(get_bl_obj_tight_name(self.model))
         msb.auto_model(part, msb_model_name, map_stem)
+        if model_key is not None and part.model is not None:
+            _CACHED_MSB_MODELS[model_key] = part.model
 
     @classmethod
     def batch_import_models(
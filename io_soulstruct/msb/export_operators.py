@@ -5,13 +5,15 @@ __all__ = [
 ]
 
 import re
-import traceback
 import typing as tp
+from operator import itemgetter
 from pathlib import Path
 
 import bpy
 from io_soulstruct.general.game_config import GAME_CONFIG
+from io_soulstruct.msb.darksouls1ptde.parts.msb_part import cached_msb_models
 from io_soulstruct.collision.types import BlenderMapCollision
+from io_soulstruct.collision.utilities import get_relative_hkxbhd_hkxbdt_paths
 from io_soulstruct.navmesh.nvm.types import BlenderNVM
 from io_soulstruct.types import SoulstructType
 from io_soulstruct.utilities.operators import LoggingOperator
@@ -95,29 +97,32 @@ class ExportMapMSB(LoggingOperator):
         # We don't care about where they appear, or how they are parented. (All Parts/Regions will have their WORLD
         # transforms used, so users can parent these purely as a matter of their own convenience, even though the MSB
         # supports no such parenting. Events have no transform.)
-        bl_parts = []
-        bl_regions = []
-        bl_events = []
+        # Each object's name and type are read (through RNA) only once here. Natural sort keys are computed from the
+        # same name and stored alongside the object, so sorting below never reads `obj.name` again.
+        keyed_objs_by_type = {
+            SoulstructType.MSB_PART: [],
+            SoulstructType.MSB_REGION: [],
+            SoulstructType.MSB_EVENT: [],
+        }  # type: dict[SoulstructType, list[tuple[list, bpy.types.Object]]]
         checked_names = set()
 
         collections = [context.collection] + list(context.collection.children_recursive)
         for col in collections:
             for obj in col.objects:
-                if obj.name in checked_names:
+                name = obj.name
+                if name in checked_names:
                     continue
-                checked_names.add(obj.name)
-                if obj.soulstruct_type == SoulstructType.MSB_PART:
-                    bl_parts.append(obj)
-                elif obj.soulstruct_type == SoulstructType.MSB_REGION:
-                    bl_regions.append(obj)
-                elif obj.soulstruct_type == SoulstructType.MSB_EVENT:
-                    bl_events.append(obj)
+                checked_names.add(name)
+                keyed_objs = keyed_objs_by_type.get(obj.soulstruct_type)
+                if keyed_objs is not None:
+                    keyed_objs.append((natural_keys(name), obj))
                 # Otherwise, ignore. We allow the user to include non-Soulstruct objects in the MSB collection.
 
-        # Sort by natural order to match Blender hierarchy.
-        bl_parts.sort(key=lambda x: natural_keys(x.name))
-        bl_regions.sort(key=lambda x: natural_keys(x.name))
-        bl_events.sort(key=lambda x: natural_keys(x.name))
+        # Sort by natural order to match Blender hierarchy. (Key-only sort, as objects themselves are not comparable.)
+        bl_parts, bl_regions, bl_events = (
+            [obj for _, obj in sorted(keyed_objs, key=itemgetter(0))]
+            for keyed_objs in keyed_objs_by_type.values()
+        )
 
         self.to_object_mode()
 
@@ -135,27 +140,33 @@ class ExportMapMSB(LoggingOperator):
             region_count += 1
             # self.info(f"Added MSB Region: {msb_region.name}")
 
-        # We add Parts next, carefully by subtype.
+        # We add Parts next, carefully by subtype. Parts are grouped by subtype in one pass (reading each subtype
+        # through RNA once) rather than filtering all parts again for every subtype. Sorted order is preserved.
+        bl_parts_by_subtype = {}  # type: dict[MSBPartSubtype, list[bpy.types.Object]]
+        for obj in bl_parts:
+            bl_parts_by_subtype.setdefault(obj.MSB_PART.part_subtype_enum, []).append(obj)
         part_classes = BLENDER_MSB_PART_TYPES[settings.game]  # type: dict[str, type[IBlenderMSBPart]]
         part_count = 0
-        for bl_part_subtype in self.PART_SUBTYPE_ORDER:
-            try:
-                bl_part_type = part_classes[bl_part_subtype]
-            except KeyError:
-                continue  # not supported by this game
-
-            # Get subtype parts. They are already sorted from above.
-            bl_subtype_parts = [obj for obj in bl_parts if obj.MSB_PART.part_subtype_enum == bl_part_subtype]
-            self.info(f"Adding {len(bl_subtype_parts)} {bl_part_subtype} parts.")
-
-            # The same Blender part subtype may be exported as multiple real subtypes (e.g. Object and DummyObject) so
-            # we need to detect the correct MSB list on an individual basis.
-            for bl_part_obj in bl_subtype_parts:
-                bl_part = bl_part_type(bl_part_obj)  # type: IBlenderMSBPart
-                msb_part = bl_part.to_soulstruct_obj(self, context, map_stem, msb)  # will create and add MSB model
-                msb.add_entry(msb_part)
-                part_count += 1
-                # self.info(f"Added {bl_part_subtype} MSB Part: {msb_part.name}")
+        # Models shared by many parts are only found (or created) in the MSB once.
+        with cached_msb_models():
+            for bl_part_subtype in self.PART_SUBTYPE_ORDER:
+                try:
+                    bl_part_type = part_classes[bl_part_subtype]
+                except KeyError:
+                    continue  # not supported by this game
+
+                # Get subtype parts. They are already sorted from above.
+                bl_subtype_parts = bl_parts_by_subtype.get(bl_part_subtype, [])
+                self.info(f"Adding {len(bl_subtype_parts)} {bl_part_subtype} parts.")
+
+                # The same Blender part subtype may be exported as multiple real subtypes (e.g. Object and DummyObject)
+                # so we need to detect the correct MSB list on an individual basis.
+                for bl_part_obj in bl_subtype_parts:
+                    bl_part = bl_part_type(bl_part_obj)  # type: IBlenderMSBPart
+                    msb_part = bl_part.to_soulstruct_obj(self, context, map_stem, msb)  # will create and add MSB model
+                    msb.add_entry(msb_part)
+                    part_count += 1
+                    # self.info(f"Added {bl_part_subtype} MSB Part: {msb_part.name}")
 
         # Sort all Models by name.
         for list_name in msb.get_subtype_list_names():
@@ -180,7 +191,9 @@ class ExportMapMSB(LoggingOperator):
         relative_msb_path = settings.get_relative_msb_path(map_stem)  # will use latest MSB version
 
         try:
-            settings.export_file(self, msb, relative_msb_path, class_name="MSB")
+            # MSBs are often re-exported without changes (e.g. to write navmesh or collision binders below), so we
+            # skip rewriting (and backing up) identical MSB files.
+            settings.export_file(self, msb, relative_msb_path, class_name="MSB", skip_unchanged=True)
         except Exception as ex:
             # Do not try to export NVMBND or NVMDUMP below.
             return self.error(f"Could not export MSB. Error: {ex}")
@@ -208,15 +221,13 @@ class ExportMapMSB(LoggingOperator):
 
         if export_settings.export_navmesh_models and settings.is_game_ds1():
             bl_navmesh_type = part_classes[MSBPartSubtype.Navmesh]
-            bl_navmesh_parts = [
-                bl_navmesh_type(obj) for obj in bl_parts if obj.MSB_PART.part_subtype == MSBPartSubtype.Navmesh
-            ]
+            bl_navmesh_parts = [bl_navmesh_type(obj) for obj in bl_parts_by_subtype.get(MSBPartSubtype.Navmesh, [])]
             self.export_nvmbnd(context, map_stem, bl_navmesh_parts)
 
         if export_settings.export_collision_models and settings.is_game("DARK_SOULS_DSR"):
             bl_collision_type = part_classes[MSBPartSubtype.Collision]
             bl_collision_parts = [
-                bl_collision_type(obj) for obj in bl_parts if obj.MSB_PART.part_subtype == MSBPartSubtype.Collision
+                bl_collision_type(obj) for obj in bl_parts_by_subtype.get(MSBPartSubtype.Collision, [])
             ]
             self.export_hkxbhds(context, map_stem, bl_collision_parts)
 
@@ -246,7 +257,7 @@ class ExportMapMSB(LoggingOperator):
             try:
                 nvm = BlenderNVM(bl_navmesh.model).to_soulstruct_obj(self, context)
             except Exception as ex:
-                traceback.print_exc()
+                self.print_debug_traceback()
                 self.error(f"Could not export NVM navmesh model. Error: {ex}")
                 continue
             else:
@@ -273,11 +284,12 @@ class ExportMapMSB(LoggingOperator):
         dcx_type = settings.game.get_dcx_type("hkx")  # will have DCX inside HKXBHD
 
         both_res_hkxbhd = BothResHKXBHD(
-            hi_res=HKXBHD(map_stem=map_stem, path=Path(f"map/{map_stem}/h{map_stem[1:]}.hkxbhd")),
-            lo_res=HKXBHD(map_stem=map_stem, path=Path(f"map/{map_stem}/l{map_stem[1:]}.hkxbhd")),
+            hi_res=HKXBHD(map_stem=map_stem, path=get_relative_hkxbhd_hkxbdt_paths(map_stem, "h")[0]),
+            lo_res=HKXBHD(map_stem=map_stem, path=get_relative_hkxbhd_hkxbdt_paths(map_stem, "l")[0]),
             path=Path(f"map/{map_stem}"),
         )  # brand new empty HKXBHDs
         added_models = set()
+        scratch_arrays = {}  # `foreach_get` read buffers reused for all collision meshes in this export
 
         for bl_collision in bl_collisions:
             if not bl_collision.model:
@@ -292,7 +304,9 @@ class ExportMapMSB(LoggingOperator):
 
             bl_collision_model = BlenderMapCollision(bl_collision.model)
             try:
-                hi_hkx, lo_hkx = bl_collision_model.to_hkx_pair(self, require_hi=True, use_hi_if_missing_lo=True)
+                hi_hkx, lo_hkx = bl_collision_model.to_hkx_pair(
+                    self, require_hi=True, use_hi_if_missing_lo=True, scratch_arrays=scratch_arrays
+                )
             except Exception as ex:
                 self.error(f"Cannot get exported hi/lo HKX for '{bl_collision.model.name}'. Error: {ex}")
                 continue
@@ -307,9 +321,14 @@ class ExportMapMSB(LoggingOperator):
             return {"CANCELLED"}
 
         try:
-            # HKX paths are already set to correct relative path.
-            settings.export_file(self, both_res_hkxbhd.hi_res, both_res_hkxbhd.hi_res.path)
-            settings.export_file(self, both_res_hkxbhd.lo_res, both_res_hkxbhd.lo_res.path)
+            # HKX paths are already set to correct relative path. Both resolutions are written concurrently.
+            settings.export_files(
+                self,
+                [
+                    (both_res_hkxbhd.hi_res, both_res_hkxbhd.hi_res.path),
+                    (both_res_hkxbhd.lo_res, both_res_hkxbhd.lo_res.path),
+                ],
+            )
         except Exception as ex:
             return self.error(f"MSB {map_stem} was exported, but could not export new Collision HKXBHDs. Error: {ex}")
 
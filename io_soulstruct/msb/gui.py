@@ -85,7 +85,7 @@ class MSBImportExportPanel(bpy.types.Panel):
         header, panel = layout.panel("MSB Export Settings", default_closed=True)
         header.label(text="MSB Export Settings")
         if panel:
-            panel.prop(context.scene.soulstruct_settings, "detect_map_from_collection")
+            panel.prop(settings, "detect_map_from_collection")
             msb_export_settings = context.scene.msb_export_settings
             for prop_name in msb_export_settings.__annotations__:
                 if prop_name == "export_nvmdump" and not settings.is_game("DARK_SOULS_DSR"):
@@ -20,6 +20,7 @@ from soulstruct.darksouls1r.maps import MSB as DSR_MSB
 
 from io_soulstruct.exceptions import BatchOperationUnsupportedError, UnsupportedGameTypeError, MissingPartModelError
 from io_soulstruct.msb import darksouls1ptde, darksouls1r
+from io_soulstruct.msb.darksouls1ptde.parts.msb_collision import cached_map_collision_hkxbhds
 from io_soulstruct.general.cached import get_cached_file
 from io_soulstruct.utilities import *
 from io_soulstruct.utilities.operators import LoggingOperator, LoggingImportOperator
@@ -110,6 +111,8 @@ def _import_msb(
     part_name_filter = msb_import_settings.get_name_match_filter()
     batched_parts_with_models = {}  # for batch import attempt
     all_parts_with_models = IDList()  # for backup single import attempt
+    # Many Parts share a model, so we only search Blender for each model once.
+    found_models = set()  # type: set[tuple[type[IBlenderMSBPart], str]]
     for part in msb.get_parts():
 
         if not part.model:
@@ -121,6 +124,9 @@ def _import_msb(
             continue  # manually excluded
 
         bl_part_type = get_bl_part_type(part)
+        model_key = (bl_part_type, part.model.name)
+        if model_key in found_models:
+            continue  # ignore Part with found model
         map_dir_stem = msb_stem if bl_part_type.MODEL_USES_LATEST_MAP else oldest_map_stem
 
         try:
@@ -128,6 +134,7 @@ def _import_msb(
         except MissingPartModelError:
             pass  # queue up model to import below
         else:
+            found_models.add(model_key)
             continue  # ignore Part with found model
 
         parts = batched_parts_with_models.setdefault(part.SUBTYPE_ENUM, IDList())
@@ -159,6 +166,9 @@ def _import_msb(
         region_count += 1
 
     # 4. Import Parts in a particular order so references will exist. TODO: Currently DS1 subtypes only.
+    # Part identities are indexed once, rather than scanning `all_parts_with_models` (an `IDList`) for every Part.
+    single_import_part_ids = {id(part) for part in all_parts_with_models}
+    part_subtype_collections = {}  # type: dict[type[IBlenderMSBPart], bpy.types.Collection]
     part_count = 0
     for part_subtype in PART_SUBTYPE_ORDER:
         try:
@@ -168,14 +178,17 @@ def _import_msb(
         parts = getattr(msb, part_list_name)
         for part in parts:
             bl_part_type = get_bl_part_type(part)
-            part_subtype_collection = get_or_create_collection(
-                parts_collection,
-                f"{msb_stem} {bl_part_type.PART_SUBTYPE.get_nice_name()} Parts",
-            )
+            try:
+                part_subtype_collection = part_subtype_collections[bl_part_type]
+            except KeyError:
+                part_subtype_collection = part_subtype_collections[bl_part_type] = get_or_create_collection(
+                    parts_collection,
+                    f"{msb_stem} {bl_part_type.PART_SUBTYPE.get_nice_name()} Parts",
+                )
             try:
                 # We only import the model here if models were requested for this part subtype and batch import for
                 # this subtype was unsupported above. Otherwise, an empty model will be created (with a warning).
-                try_import_model = part in all_parts_with_models
+                try_import_model = id(part) in single_import_part_ids
                 bl_part_type.new_from_soulstruct_obj(
                     operator,
                     context,
@@ -249,7 +262,8 @@ class ImportMapMSB(LoggingOperator):
         msb = get_cached_file(msb_path, settings.get_game_msb_class())  # type: MSB_TYPING
         oldest_map_stem = settings.get_oldest_map_stem_version(msb_stem)
 
-        return _import_msb(self, context, msb, msb_stem, oldest_map_stem)
+        with cached_obj_stem_lookups(), cached_map_collision_hkxbhds():
+            return _import_msb(self, context, msb, msb_stem, oldest_map_stem)
 
 
 class ImportAnyMSB(LoggingImportOperator):
@@ -305,4 +319,5 @@ class ImportAnyMSB(LoggingImportOperator):
             except Exception as ex:
                 return self.error(f"Failed to load MSB file: {ex}")
 
-        return _import_msb(self, context, msb, msb_stem, oldest_map_stem)
+        with cached_obj_stem_lookups(), cached_map_collision_hkxbhds():
+            return _import_msb(self, context, msb, msb_stem, oldest_map_stem)
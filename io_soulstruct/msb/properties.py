@@ -1617,15 +1617,22 @@ class MSBImportSettings(bpy.types.PropertyGroup):
     )
 
     def get_name_match_filter(self) -> tp.Callable[[str], bool]:
+        # Filter is read (through RNA) once here, rather than on every call of the returned predicate.
+        name_filter = self.part_name_model_filter
         match self.part_name_filter_match_mode:
             case "GLOB":
-                def is_name_match(name: str):
-                    return self.part_name_model_filter in {"", "*"} or fnmatch(name, self.part_name_model_filter)
+                if name_filter in {"", "*"}:
+                    def is_name_match(_name: str):
+                        return True
+                else:
+                    def is_name_match(name: str):
+                        return fnmatch(name, name_filter)
             case "REGEX":
-                pattern = re.compile(self.part_name_model_filter)
-
-                def is_name_match(name: str):
-                    return self.part_name_model_filter == "" or re.match(pattern, name)
+                if name_filter == "":
+                    def is_name_match(_name: str):
+                        return True
+                else:
+                    is_name_match = re.compile(name_filter).match
             case _:  # should never happen
                 raise ValueError(f"Invalid MSB Part name match mode: {self.part_name_filter_match_mode}")
         return is_name_match
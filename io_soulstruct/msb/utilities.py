@@ -18,7 +18,6 @@ import re
 import shutil
 import tempfile
 import time
-import traceback
 import typing as tp
 from pathlib import Path
 
@@ -313,7 +312,7 @@ def batch_import_flver_models(
                 bl_materials=bl_materials,
             )
         except Exception as ex:
-            traceback.print_exc()  # for inspection in Blender console
+            operator.print_debug_traceback()  # for inspection in Blender console
             operator.error(f"Cannot import FLVER: {flver.path_name}. Error: {ex}")
 
     operator.info(f"Imported {len(flvers)} {part_subtype_title} FLVERs in {time.perf_counter() - p:.2f} seconds.")
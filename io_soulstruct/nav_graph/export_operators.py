@@ -55,31 +55,35 @@ class ExportMCG(LoggingOperator, ExportHelper):
     @classmethod
     def poll(cls, context):
         """Requires a single selected Empty object with 'Edges' and 'Nodes children."""
-        if len(context.selected_objects) != 1:
+        selected_objects = context.selected_objects
+        if len(selected_objects) != 1:
             return False
-        obj = context.selected_objects[0]
+        obj = selected_objects[0]
         if obj.type != "EMPTY":
             return False
-        if len(obj.children) != 2:
+        children = obj.children  # each access scans all objects
+        if len(children) != 2:
             return False
-        if "Edges" in obj.children[0].name and "Nodes" in obj.children[1].name:
+        first_name, second_name = children[0].name, children[1].name
+        if "Edges" in first_name and "Nodes" in second_name:
             return True
-        if "Nodes" in obj.children[0].name and "Edges" in obj.children[1].name:
+        if "Nodes" in first_name and "Edges" in second_name:
             return True
         return False
 
     def invoke(self, context, _event):
         """Set default export name to name of object (before first space and without Blender dupe suffix)."""
-        if not context.selected_objects:
+        selected_objects = context.selected_objects
+        if not selected_objects:
             return super().invoke(context, _event)
 
-        obj = context.selected_objects[0]
+        obj = selected_objects[0]
         self.filepath = get_bl_obj_tight_name(obj, new_ext=".mcg")
         context.window_manager.fileselect_add(self)
         return {"RUNNING_MODAL"}
 
     def execute(self, context):
-        selected_objs = [obj for obj in context.selected_objects]
+        selected_objs = context.selected_objects
         if not selected_objs:
             return self.error("No Empty with Edges and Nodes child Empties selected for MCG export.")
         if len(selected_objs) > 1:
@@ -167,21 +171,24 @@ class ExportMCGMCPToMap(LoggingOperator):
             return False
         if not settings.is_game(DARK_SOULS_DSR):
             return False
-        if len(context.selected_objects) != 1:
+        selected_objects = context.selected_objects
+        if len(selected_objects) != 1:
             return False
-        obj = context.selected_objects[0]
+        obj = selected_objects[0]
         if obj.type != "EMPTY":
             return False
-        if len(obj.children) != 2:
+        children = obj.children  # each access scans all objects
+        if len(children) != 2:
             return False
-        if "Edges" in obj.children[0].name and "Nodes" in obj.children[1].name:
+        first_name, second_name = children[0].name, children[1].name
+        if "Edges" in first_name and "Nodes" in second_name:
             return True
-        if "Nodes" in obj.children[0].name and "Edges" in obj.children[1].name:
+        if "Nodes" in first_name and "Edges" in second_name:
             return True
         return False
 
     def execute(self, context):
-        selected_objs = [obj for obj in context.selected_objects]
+        selected_objs = context.selected_objects
         if not selected_objs:
             return self.error("No Empty with Edges and Nodes child Empties selected for MCG export.")
         if len(selected_objs) > 1:
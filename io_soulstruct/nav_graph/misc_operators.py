@@ -130,13 +130,14 @@ class JoinMCGNodesThroughNavmesh(LoggingOperator):
         except ValueError:
             raise MCGEdgeCreationError("Selected MCG parent object is not a valid MCG object.")
 
+        selected_objects = context.selected_objects
         try:
-            node_a, node_b = [obj for obj in context.selected_objects if obj.soulstruct_type == SoulstructType.MCG_NODE]
+            node_a, node_b = [obj for obj in selected_objects if obj.soulstruct_type == SoulstructType.MCG_NODE]
         except ValueError:
             raise MCGEdgeCreationError("Must select exactly two MCG Nodes.")
 
         navmesh_parts = [
-            obj for obj in context.selected_objects
+            obj for obj in selected_objects
             if obj.soulstruct_type == SoulstructType.MSB_PART
             and obj.MSB_PART.part_subtype == "Navmesh"
         ]
@@ -199,9 +200,10 @@ class SetNodeNavmeshTriangles(LoggingOperator):
         if context.mode != "EDIT_MESH" or not context.edit_object:
             return False
         # Have to account for the edited Mesh itself maybe not being selected. (We don't care.)
-        if not context.selected_objects or len(context.selected_objects) > 2:
+        selected_objects = context.selected_objects
+        if not selected_objects or len(selected_objects) > 2:
             return False
-        return context.selected_objects[0].soulstruct_type == SoulstructType.MCG_NODE
+        return selected_objects[0].soulstruct_type == SoulstructType.MCG_NODE
 
     def execute(self, context):
 
@@ -37,11 +37,12 @@ class BlenderMCG(SoulstructObject[MCG, MCGProps]):
 
         # MCG parent should have two Empty children: a 'Nodes' sub-parent and an 'Edges' sub-parent.
         # We look for these by name, ignoring Blender dupe suffix.
-        if len(obj.children) != 2:
+        children = obj.children  # each access scans all objects
+        if len(children) != 2:
             raise ValueError(
                 f"MCG object '{obj.name}' must have exactly two children: '{{name}} Nodes' and '{{name}} Edges'."
             )
-        for child in obj.children:
+        for child in children:
             name = remove_dupe_suffix(child.name)
             if name.lower().endswith("nodes"):
                 self.node_parent = child
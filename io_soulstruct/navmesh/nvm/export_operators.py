@@ -7,6 +7,8 @@ __all__ = [
 ]
 
 import traceback
+import typing as tp
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import bpy
@@ -22,6 +24,9 @@ from io_soulstruct.utilities.operators import LoggingOperator, get_dcx_enum_prop
 from io_soulstruct.utilities.misc import *
 from .types import *
 
+if tp.TYPE_CHECKING:
+    from soulstruct.darksouls1r.maps.navmesh import NVM
+
 
 class ExportLooseNVM(LoggingOperator, ExportHelper):
     """Export loose NVM file from a Blender mesh.
@@ -52,7 +57,7 @@ class ExportLooseNVM(LoggingOperator, ExportHelper):
             return super().invoke(context, _event)
 
         obj = context.active_object
-        model_stem = obj.name.split(".")[0].split(" ")[0]
+        model_stem = obj.name.partition(".")[0].partition(" ")[0]
         settings = self.settings(context)
         self.filepath = settings.game.process_dcx_path(f"{model_stem}.nvm")
         context.window_manager.fileselect_add(self)
@@ -138,6 +143,16 @@ class ExportNVMIntoBinder(LoggingOperator, ImportHelper):
             return self.error(f"Could not load Binder file. Error: {ex}.")
         binder_stem = binder.path.name.split(".")[0]
 
+        # Index existing NVM entries by stem once, rather than regex-scanning all entries for every exported NVM.
+        nvm_entries_by_stem = {}  # type: dict[str, list[BinderEntry]]
+        for entry in binder.entries:
+            entry_stem, dot_nvm, dcx_ext = entry.name.partition(".nvm")
+            if dot_nvm and dcx_ext in {"", ".dcx"}:
+                nvm_entries_by_stem.setdefault(entry_stem, []).append(entry)
+        next_entry_id = binder.highest_entry_id + 1  # tracked locally as new entries are added below
+        # Keys are `id(entry)`, so that an entry exported to more than once keeps only its last NVM (as before).
+        nvms_by_entry_id = {}  # type: dict[int, tuple[BinderEntry, NVM]]
+
         for bl_nvm in selected_bl_nvms:
             model_stem = bl_nvm.export_name
 
@@ -149,7 +164,7 @@ class ExportNVMIntoBinder(LoggingOperator, ImportHelper):
             else:
                 nvm.dcx_type = DCXType[self.dcx_type]  # most likely `Null` for file in `nvmbnd` Binder
 
-            matching_entries = binder.find_entries_matching_name(rf"{model_stem}\.nvm(\.dcx)?")
+            matching_entries = nvm_entries_by_stem.get(model_stem)
             if not matching_entries:
                 # Create new entry.
                 if "{map}" in self.default_entry_path:
@@ -163,11 +178,13 @@ class ExportNVMIntoBinder(LoggingOperator, ImportHelper):
                     entry_path = self.default_entry_path.format(map=map_str, name=model_stem)
                 else:
                     entry_path = self.default_entry_path.format(name=model_stem)
-                new_entry_id = binder.highest_entry_id + 1
+                new_entry_id = next_entry_id
+                next_entry_id += 1
                 nvm_entry = BinderEntry(
                     b"", entry_id=new_entry_id, path=entry_path, flags=self.default_entry_flags
                 )
                 binder.add_entry(nvm_entry)
+                nvm_entries_by_stem[model_stem] = [nvm_entry]
                 self.info(f"Creating new Binder entry: ID {new_entry_id}, path '{entry_path}'")
             else:
                 if not self.overwrite_existing:
@@ -185,11 +202,29 @@ class ExportNVMIntoBinder(LoggingOperator, ImportHelper):
                         f"Replacing existing Binder entry: ID {nvm_entry.entry_id}, path '{nvm_entry.path}'"
                     )
 
-            try:
-                nvm_entry.set_from_binary_file(nvm)
-            except Exception as ex:
-                traceback.print_exc()
-                return self.error(f"Cannot write exported NVM. Error: {ex}")
+            nvms_by_entry_id[id(nvm_entry)] = (nvm_entry, nvm)
+
+        # Entry data is packed only after all NVMs are converted. If entries are DCX-compressed, they are packed
+        # concurrently, as compression of separate entries is independent.
+        if DCXType[self.dcx_type] == DCXType.Null:
+            for nvm_entry, nvm in nvms_by_entry_id.values():
+                try:
+                    nvm_entry.set_from_binary_file(nvm)
+                except Exception as ex:
+                    traceback.print_exc()
+                    return self.error(f"Cannot write exported NVM. Error: {ex}")
+        else:
+            with ThreadPoolExecutor() as executor:
+                futures = [
+                    executor.submit(nvm_entry.set_from_binary_file, nvm)
+                    for nvm_entry, nvm in nvms_by_entry_id.values()
+                ]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as ex:
+                    traceback.print_exc()
+                    return self.error(f"Cannot write exported NVM. Error: {ex}")
 
         try:
             # Will create a `.bak` file automatically if absent.
@@ -235,10 +270,16 @@ class ExportNVMIntoSelectedMap(LoggingOperator):
 
         opened_nvmbnds = {}  # type: dict[Path, NVMBND]
         bl_nvms = BlenderNVM.from_selected_objects(context)  # type: list[BlenderNVM]
+        collection_map_stems = (
+            get_collection_map_stems(bl_nvm.obj for bl_nvm in bl_nvms) if settings.detect_map_from_collection else {}
+        )
+        latest_map_stems = {}  # type: dict[str, str]  # detected map stem -> latest version
 
         for bl_nvm in bl_nvms:
             # NVMBND files come from latest 'map' folder version.
-            map_stem = settings.get_map_stem_for_export(bl_nvm.obj, latest=True)
+            map_stem = settings.get_map_stem_for_export(
+                bl_nvm.obj, latest=True, collection_map_stems=collection_map_stems, versioned_map_stems=latest_map_stems
+            )
             relative_nvmbnd_path = Path(f"map/{map_stem}/{map_stem}.nvmbnd")
 
             if relative_nvmbnd_path not in opened_nvmbnds:
@@ -261,7 +302,7 @@ class ExportNVMIntoSelectedMap(LoggingOperator):
             try:
                 nvm = bl_nvm.to_soulstruct_obj(self, context)
             except Exception as ex:
-                traceback.print_exc()
+                self.print_debug_traceback()
                 self.error(f"Cannot get exported NVM. Error: {ex}")
                 continue
             else:
@@ -269,10 +310,11 @@ class ExportNVMIntoSelectedMap(LoggingOperator):
 
             nvmbnd.nvms[model_stem] = nvm  # no extension needed
 
-        for relative_nvmbnd_path, nvmbnd in opened_nvmbnds.items():
+        for nvmbnd in opened_nvmbnds.values():
             nvmbnd.entries = list(sorted(nvmbnd.entries, key=lambda e: e.name))
             for i, entry in enumerate(nvmbnd.entries):
                 entry.entry_id = i
-            settings.export_file(self, nvmbnd, relative_nvmbnd_path)
+        # All NVMBNDs are written concurrently.
+        settings.export_files(self, [(nvmbnd, path) for path, nvmbnd in opened_nvmbnds.items()])
 
         return {"FINISHED"}
@@ -98,28 +98,43 @@ class BlenderNVM(SoulstructObject[NVM, NVMProps]):
         triangles actually matter for navigation.
         """
         mesh_data = self.obj.data
-        nvm_verts = np.array([vert.co for vert in mesh_data.vertices], dtype=np.float32)
-        # Swap Y and Z coordinates.
-        nvm_verts[:, [1, 2]] = nvm_verts[:, [2, 1]]
-
-        nvm_faces = []  # type: list[tuple[int, int, int]]
-        for face in mesh_data.polygons:
-            if len(face.vertices) != 3:
-                raise NVMExportError(
-                    f"Found a non-triangle mesh face in NVM (face {face.index}). You must triangulate it first."
-                )
-            # noinspection PyTypeChecker
-            vertices = tuple(face.vertices)  # type: tuple[int, int, int]
-            nvm_faces.append(vertices)
+        nvm_verts = np.empty(len(mesh_data.vertices) * 3, dtype=np.float32)
+        mesh_data.vertices.foreach_get("co", nvm_verts)
+        nvm_verts = nvm_verts.reshape(-1, 3)[:, (0, 2, 1)]  # swap Y and Z coordinates
+
+        # Validate triangulation for all faces at once, then read face vertex indices in bulk.
+        face_loop_totals = np.empty(len(mesh_data.polygons), dtype=np.int32)
+        mesh_data.polygons.foreach_get("loop_total", face_loop_totals)
+        non_triangle_face_indices = np.flatnonzero(face_loop_totals != 3)
+        if non_triangle_face_indices.size:
+            raise NVMExportError(
+                f"Found a non-triangle mesh face in NVM (face {non_triangle_face_indices[0]}). You must triangulate it "
+                f"first."
+            )
+        face_vertex_indices = np.empty(len(mesh_data.polygons) * 3, dtype=np.int32)
+        mesh_data.polygons.foreach_get("vertices", face_vertex_indices)
+        # noinspection PyTypeChecker
+        nvm_faces = list(map(tuple, face_vertex_indices.reshape(-1, 3).tolist()))  # type: list[tuple[int, int, int]]
+
+        # Map each undirected edge to the (ordered) indices of all faces using it, iterating over faces just once.
+        edge_face_indices = {}  # type: dict[tuple[int, int], list[int]]
+        for i, (v1, v2, v3) in enumerate(nvm_faces):
+            for edge in {(min(v1, v2), max(v1, v2)), (min(v2, v3), max(v2, v3)), (min(v1, v3), max(v1, v3))}:
+                edge_face_indices.setdefault(edge, []).append(i)
 
         def find_connected_face_index(edge_v1: int, edge_v2: int, not_face) -> int:
             """Find face that shares an edge with the given edge.
 
             Returns -1 if no connected face is found (i.e. edge is on the edge of the mesh).
             """
-            # TODO: Could surely iterate over faces just once for this?
-            for i_, f_ in enumerate(nvm_faces):
-                if f_ != not_face and edge_v1 in f_ and edge_v2 in f_:  # order doesn't matter
+            if edge_v1 == edge_v2:
+                # Degenerate edge. Any face using this vertex is connected.
+                for i_, f_ in enumerate(nvm_faces):
+                    if f_ != not_face and edge_v1 in f_:
+                        return i_
+                return -1
+            for i_ in edge_face_indices[min(edge_v1, edge_v2), max(edge_v1, edge_v2)]:  # order doesn't matter
+                if nvm_faces[i_] != not_face:
                     return i_
             return -1
 
@@ -32,13 +32,10 @@ class NVMHKTImporter:
     ) -> bpy.types.MeshObject:
         """Read a NVMHKT into a Blender mesh object."""
 
-        # Set mode to OBJECT and deselect all objects.
-        if bpy.ops.object.mode_set.poll():
-            bpy.ops.object.mode_set(mode="OBJECT", toggle=False)
-        if bpy.ops.object.select_all.poll():
-            bpy.ops.object.select_all(action="DESELECT")
-        if bpy.ops.object.mode_set.poll():  # just to be safe
-            bpy.ops.object.mode_set(mode="OBJECT", toggle=False)
+        # Set mode to OBJECT (skipped if already in it, which is typical after the first of many imports) and deselect
+        # all objects.
+        self.operator.to_object_mode()
+        self.operator.deselect_all()
 
         # Create mesh.
         bl_mesh = bpy.data.meshes.new(name=name)
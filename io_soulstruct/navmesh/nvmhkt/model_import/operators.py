@@ -478,8 +478,9 @@ class ImportAllNVMHKTsFromNVMHKTBND(ImportAllNVMHKTBase):
 
                 if small_tile_match and len(bl_nvmhkt.data.vertices) == 0:
                     # Import 'q' quarter navmeshes instead.
+                    q_entry_stem = f"q{map_stem[1:]}_{grid_x:02}{grid_y:02}00"
                     for i in range(4):
-                        hkx_entry_name = f"q{map_stem[1:]}_{grid_x:02}{grid_y:02}00_{i}.hkx"
+                        hkx_entry_name = f"{q_entry_stem}_{i}.hkx"
                         try:
                             bl_nvmhkt_q = self.import_nvmhktbnd_entry(context, collection, nvmhktbnd, hkx_entry_name)
                         except EntryNotFoundError:
@@ -639,6 +640,8 @@ class ImportAllOverworldNVMHKTsBase(ImportAllNVMHKTBase):
 
             grid_x = int(nvmhktbnd_path.name[4:6])
             grid_y = int(nvmhktbnd_path.name[7:9])  # Z in game, but Y in Blender
+            # All entry names in this binder share this suffix after their one-character 'n'/'q'/'o' prefix.
+            entry_suffix = f"{map_stem[1:]}_{grid_x:02}{grid_y:02}00"
 
             nvmhktbnd = Binder.from_path(nvmhktbnd_path)
 
@@ -647,7 +650,7 @@ class ImportAllOverworldNVMHKTsBase(ImportAllNVMHKTBase):
             if import_settings.import_hires_navmeshes:
 
                 # Should be only one 'n' entry.
-                hkx_entry_name = f"n{map_stem[1:]}_{grid_x:02}{grid_y:02}00.hkx"
+                hkx_entry_name = f"n{entry_suffix}.hkx"
 
                 try:
                     bl_nvmhkt_n = self.import_nvmhktbnd_entry(context, collection, nvmhktbnd, hkx_entry_name)
@@ -664,7 +667,7 @@ class ImportAllOverworldNVMHKTsBase(ImportAllNVMHKTBase):
                     bpy.data.objects.remove(bl_nvmhkt_n)
 
                     for i in range(4):
-                        hkx_entry_name = f"q{map_stem[1:]}_{grid_x:02}{grid_y:02}00_{i}.hkx"
+                        hkx_entry_name = f"q{entry_suffix}_{i}.hkx"
                         try:
                             bl_nvmhkt_q = self.import_nvmhktbnd_entry(context, collection, nvmhktbnd, hkx_entry_name)
                         except EntryNotFoundError:
@@ -682,7 +685,7 @@ class ImportAllOverworldNVMHKTsBase(ImportAllNVMHKTBase):
             if import_settings.import_lores_navmeshes:
 
                 # Should be only one 'o' entry.
-                hkx_entry_name = f"o{map_stem[1:]}_{grid_x:02}{grid_y:02}00.hkx"
+                hkx_entry_name = f"o{entry_suffix}.hkx"
 
                 try:
                     bl_nvmhkt_o = self.import_nvmhktbnd_entry(context, collection, nvmhktbnd, hkx_entry_name)
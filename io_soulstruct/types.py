@@ -87,19 +87,20 @@ class SoulstructObject(abc.ABC, tp.Generic[SOULSTRUCT_T, SOULSTRUCT_PROPS_T]):
         data: bpy.types.Mesh | None,
         collection: bpy.types.Collection = None,
     ) -> tp.Self:
+        from io_soulstruct.utilities.bpy_data import new_empty_object, new_mesh_object
+
         match cls.OBJ_DATA_TYPE:
             case SoulstructDataType.EMPTY:
                 if data is not None:
                     raise SoulstructTypeError(f"Cannot create an EMPTY object with data.")
-                obj = bpy.data.objects.new(name, None)
+                obj = new_empty_object(name, cls.TYPE)
             case SoulstructDataType.MESH:
                 # NOT permitted to be initialized as Empty.
                 if not isinstance(data, bpy.types.Mesh):
                     raise SoulstructTypeError(f"Data for MESH object must be a Mesh, not {type(data).__name__}.")
-                obj = bpy.data.objects.new(name, data)
+                obj = new_mesh_object(name, data, cls.TYPE)
             case _:
                 raise SoulstructTypeError(f"Unsupported Soulstruct OBJ_DATA_TYPE '{cls.OBJ_DATA_TYPE}'.")
-        obj.soulstruct_type = cls.TYPE
         (collection or bpy.context.scene.collection).objects.link(obj)
         return cls(obj)
 
@@ -176,7 +177,7 @@ class SoulstructObject(abc.ABC, tp.Generic[SOULSTRUCT_T, SOULSTRUCT_PROPS_T]):
     def tight_name(self):
         """Get the name of the object before the first space AND first dot (which automatically trims Blender duplicate
         suffixes like '.002'). Used when exporting some game types."""
-        return self.name.split(".")[0].split(" ")[0]
+        return self.name.partition(".")[0].partition(" ")[0]
 
     @property
     def export_name(self):
@@ -225,21 +226,23 @@ class SoulstructObject(abc.ABC, tp.Generic[SOULSTRUCT_T, SOULSTRUCT_PROPS_T]):
 
     @classmethod
     def from_selected_object(cls, context: bpy.types.Context) -> tp.Self:
-        if not context.selected_objects:
+        selected_objects = context.selected_objects
+        if not selected_objects:
             raise SoulstructTypeError(f"No selected object to become a {cls.TYPE} Soulstruct object.")
-        if len(context.selected_objects) > 1:
+        if len(selected_objects) > 1:
             raise SoulstructTypeError(f"More than one object selected; expected only one.")
-        obj = context.selected_objects[0]
+        obj = selected_objects[0]
         if obj.soulstruct_type != cls.TYPE:
             raise SoulstructTypeError(f"Selected object '{obj}' is not a {cls.TYPE} Soulstruct object.")
         return cls(obj)
 
     @classmethod
     def from_selected_objects(cls, context: bpy.types.Context) -> list[tp.Self]:
-        if not context.selected_objects:
+        selected_objects = context.selected_objects
+        if not selected_objects:
             raise SoulstructTypeError(f"No selected objects to become {cls.TYPE} Soulstruct objects.")
         selfs = []
-        for obj in context.selected_objects:
+        for obj in selected_objects:
             if obj.soulstruct_type != cls.TYPE:
                 raise SoulstructTypeError(f"Selected object '{obj}' is not a {cls.TYPE} Soulstruct object.")
             selfs.append(cls(obj))
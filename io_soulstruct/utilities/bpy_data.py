@@ -4,6 +4,8 @@ __all__ = [
     "new_mesh_object",
     "new_armature_object",
     "new_empty_object",
+    "cached_obj_stem_lookups",
+    "build_children_index",
     "find_obj",
     "find_obj_or_create_empty",
     "copy_obj_property_group",
@@ -11,6 +13,7 @@ __all__ = [
 ]
 
 import typing as tp
+from contextlib import contextmanager
 
 import bpy
 
@@ -21,11 +24,22 @@ if tp.TYPE_CHECKING:
     PROPS_TYPE = tp.Union[tp.Dict[str, tp.Any], bpy.types.Object, None]
 
 
+# Maps `(tight name, soulstruct_type)` to the first such object. Only active inside `cached_obj_stem_lookups()`.
+_OBJ_STEM_INDEX = None  # type: dict[tuple[str, str], bpy.types.Object] | None
+
+
+def _index_new_obj(obj: bpy.types.Object):
+    """Add a newly created object to the active stem index, if any, so index misses stay trustworthy."""
+    if _OBJ_STEM_INDEX is not None:
+        _OBJ_STEM_INDEX.setdefault((get_bl_obj_tight_name(obj), obj.soulstruct_type), obj)
+
+
 def new_mesh_object(
     name: str, data: bpy.types.Mesh, soulstruct_type: SoulstructType = SoulstructType.NONE
 ) -> bpy.types.MeshObject:
     mesh_obj = bpy.data.objects.new(name, data)
     mesh_obj.soulstruct_type = soulstruct_type
+    _index_new_obj(mesh_obj)
     # noinspection PyTypeChecker
     return mesh_obj
 
@@ -37,6 +51,7 @@ def new_armature_object(
 ) -> bpy.types.ArmatureObject:
     armature_obj = bpy.data.objects.new(name, data)
     armature_obj.soulstruct_type = soulstruct_type
+    _index_new_obj(armature_obj)
     # noinspection PyTypeChecker
     return armature_obj
 
@@ -45,9 +60,66 @@ def new_empty_object(name: str, soulstruct_type: SoulstructType = SoulstructType
     # noinspection PyTypeChecker
     empty_obj = bpy.data.objects.new(name, None)
     empty_obj.soulstruct_type = soulstruct_type
+    _index_new_obj(empty_obj)
     return empty_obj
 
 
+@contextmanager
+def cached_obj_stem_lookups():
+    """Within this context, stem lookups in `find_obj()` and `find_obj_or_create_empty()` use an index of all object
+    tight names rather than scanning all of `bpy.data.objects` on every exact-name miss.
+
+    Use around operations that look up many objects (e.g. MSB import). The index is built once on entry and objects
+    created through the `new_*_object()` functions above (or `SoulstructObject.new()`) are added to it, so objects must
+    not be created with `bpy.data.objects.new()` directly inside this context if they are to be found by stem.
+    """
+    global _OBJ_STEM_INDEX
+    if _OBJ_STEM_INDEX is not None:
+        yield  # already active
+        return
+    _OBJ_STEM_INDEX = {}
+    for obj in bpy.data.objects:
+        _OBJ_STEM_INDEX.setdefault((get_bl_obj_tight_name(obj), obj.soulstruct_type), obj)
+    try:
+        yield
+    finally:
+        _OBJ_STEM_INDEX = None
+
+
+def _find_obj_by_stem(name: str, soulstruct_type: SoulstructType) -> bpy.types.Object | None:
+    """Find an object with the given tight name stem (e.g. "h1234" for "h1234 (Floor).003") and Soulstruct type."""
+    if _OBJ_STEM_INDEX is None:
+        for obj in bpy.data.objects:
+            if get_bl_obj_tight_name(obj) == name and obj.soulstruct_type == soulstruct_type:
+                return obj
+        return None
+
+    key = (name, soulstruct_type)
+    obj = _OBJ_STEM_INDEX.get(key)
+    if obj is None or (get_bl_obj_tight_name(obj) == name and obj.soulstruct_type == soulstruct_type):
+        return obj
+    # Hit was renamed or retyped since it was indexed. Rescan for this key only.
+    del _OBJ_STEM_INDEX[key]
+    for obj in bpy.data.objects:
+        if get_bl_obj_tight_name(obj) == name and obj.soulstruct_type == soulstruct_type:
+            _OBJ_STEM_INDEX[key] = obj
+            return obj
+    return None
+
+
+def build_children_index() -> dict[str, list[bpy.types.Object]]:
+    """Map parent object names to their immediate children in a single pass over `bpy.data.objects`.
+
+    Every `Object.children` access scans all Blender objects, so operators that need the children of many objects
+    should build this once per `execute()` rather than accessing `children` per object.
+    """
+    children_index = {}  # type: dict[str, list[bpy.types.Object]]
+    for obj in bpy.data.objects:
+        if obj.parent is not None:
+            children_index.setdefault(obj.parent.name, []).append(obj)
+    return children_index
+
+
 def find_obj(
     name: str,
     find_stem=False,
@@ -59,11 +131,8 @@ def find_obj(
             raise KeyError
         return bpy.data.objects[name]
     except KeyError:
-        if find_stem:
-            # Try to find an object with the same stem (e.g. "h1234" for "h1234 (Floor).003").
-            for obj in bpy.data.objects:
-                if get_bl_obj_tight_name(obj) == name and (soulstruct_type and obj.soulstruct_type == soulstruct_type):
-                    return obj
+        if find_stem and soulstruct_type:
+            return _find_obj_by_stem(name, soulstruct_type)
     return None
 
 
@@ -79,16 +148,16 @@ def find_obj_or_create_empty(
             raise KeyError
         return False, bpy.data.objects[name]
     except KeyError:
-        if find_stem:
-            # Try to find an object with the same stem (e.g. "h1234" for "h1234 (Floor).003").
-            for obj in bpy.data.objects:
-                if get_bl_obj_tight_name(obj) == name and (soulstruct_type and obj.soulstruct_type == soulstruct_type):
-                    return False, obj
+        if find_stem and soulstruct_type:
+            obj = _find_obj_by_stem(name, soulstruct_type)
+            if obj is not None:
+                return False, obj
 
         missing_collection = get_or_create_collection(bpy.context.scene.collection, missing_collection_name)
         obj = bpy.data.objects.new(name, None)
         if soulstruct_type:
             obj.soulstruct_type = soulstruct_type
+        _index_new_obj(obj)
         missing_collection.objects.link(obj)
         return True, obj
 
@@ -11,6 +11,7 @@ __all__ = [
     "is_path_and_dir",
     "get_bl_obj_tight_name",
     "get_collection_map_stem",
+    "get_collection_map_stems",
     "remove_dupe_suffix",
 ]
 
@@ -153,7 +154,7 @@ def get_bl_obj_tight_name(obj: bpy.types.Object, new_ext="") -> str:
 
     Can optionally add a new extension to the end of the stem.
     """
-    return obj.name.split(" ")[0].split(".")[0] + new_ext
+    return obj.name.partition(" ")[0].partition(".")[0] + new_ext
 
 
 def get_collection_map_stem(obj: bpy.types.Object) -> str:
@@ -161,16 +162,42 @@ def get_collection_map_stem(obj: bpy.types.Object) -> str:
         raise ValueError(f"Object '{obj.name}' is not in any Blender collection.")
     map_stem = None
     for collection in obj.users_collection:
-        new_match = MAP_STEM_RE.match(collection.name.split(" ")[0])
-        if new_match:
+        collection_stem = collection.name.partition(" ")[0]
+        if MAP_STEM_RE.match(collection_stem):
             if map_stem:
                 raise ValueError(f"Object '{obj.name}' is in multiple Blender collections that match map stem pattern.")
-            map_stem = collection.name.split(" ")[0]
+            map_stem = collection_stem
     if not map_stem:
         raise ValueError(f"Object '{obj.name}' is not in a Blender collection that matches map stem pattern.")
     return map_stem
 
 
+def get_collection_map_stems(objs: tp.Iterable[bpy.types.Object]) -> dict[str, str]:
+    """Batch version of `get_collection_map_stem()` that maps object names to their map stem collection names.
+
+    Walks `bpy.data.collections` once, rather than resolving `users_collection` (which scans every collection) for each
+    object. Objects that are in no map stem collection, or more than one, are omitted; pass them to
+    `get_collection_map_stem()` for the appropriate error.
+    """
+    obj_names = {obj.name for obj in objs}
+    map_stems = {}  # type: dict[str, str]
+    ambiguous_names = set()  # type: set[str]
+    for collection in bpy.data.collections:
+        map_stem = collection.name.partition(" ")[0]
+        if not MAP_STEM_RE.match(map_stem):
+            continue
+        for obj in collection.objects:
+            if obj.name not in obj_names:
+                continue
+            if obj.name in map_stems:
+                ambiguous_names.add(obj.name)
+            else:
+                map_stems[obj.name] = map_stem
+    for name in ambiguous_names:
+        map_stems.pop(name)
+    return map_stems
+
+
 def remove_dupe_suffix(name):
     match = BLENDER_DUPE_RE.match(name)
     return match.group(1) if match else name
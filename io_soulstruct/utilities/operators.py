@@ -13,6 +13,7 @@ import abc
 import re
 import shutil
 import tempfile
+import traceback
 import typing as tp
 from pathlib import Path
 
@@ -58,6 +59,17 @@ class LoggingOperator(bpy.types.Operator):
         self.report({"ERROR"}, msg)
         return {"CANCELLED"}
 
+    @staticmethod
+    def print_debug_traceback():
+        """Print the traceback of the exception being handled, only if Blender was started with `--debug`.
+
+        For `except` blocks that report an error and continue to the next item. Formatting a traceback reads source
+        files for every frame, which can dominate export/import time when many items fail. The error message is still
+        reported either way.
+        """
+        if bpy.app.debug:
+            traceback.print_exc()
+
     def execute(self, context):
         try:
             execute = getattr(self, "_execute")
@@ -72,12 +84,14 @@ class LoggingOperator(bpy.types.Operator):
 
     @staticmethod
     def to_object_mode():
-        if bpy.ops.object.mode_set.poll():
+        # Skip the (heavy) `bpy.ops` call entirely if already in Object Mode.
+        if bpy.context.mode != "OBJECT" and bpy.ops.object.mode_set.poll():
             bpy.ops.object.mode_set(mode="OBJECT", toggle=False)
 
     @staticmethod
     def to_edit_mode():
-        if bpy.ops.object.mode_set.poll():
+        # Context mode is 'EDIT_MESH', 'EDIT_ARMATURE', etc. in Edit Mode.
+        if not bpy.context.mode.startswith("EDIT") and bpy.ops.object.mode_set.poll():
             bpy.ops.object.mode_set(mode="EDIT", toggle=False)
 
     @staticmethod